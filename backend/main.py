@@ -4,7 +4,9 @@ Main application entry point for the FastAPI backend.
 This file:
 - Initializes the FastAPI app
 - Registers all API routers (data & strategy)
+- Runs the strategy router's process pool for the app's lifetime
 - Configures CORS for frontend-backend integration
+- Uses orjson-backed JSON responses by default
 - Exposes a health check root endpoint
 """
 
@@ -12,9 +14,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.routers import data
 from backend.routers import strategy
+from backend.routers.responses import FastJSONResponse
 
-# Initialize FastAPI app
-app = FastAPI()
+# Initialize FastAPI app (orjson serialization for all JSON responses); the
+# lifespan hook starts and shuts down the per-symbol worker pool
+app = FastAPI(default_response_class=FastJSONResponse, lifespan=strategy.pool_lifespan)
 
 # Register routers from different modules
 app.include_router(strategy.router)
@@ -13,7 +13,7 @@ This includes:
 These schemas ensure structured and validated data exchange between the frontend and backend.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Union, Literal, Optional
 
 class Condition(BaseModel):
@@ -71,17 +71,13 @@ class Logic(BaseModel):
         or_ (Optional[List[Union[Condition, Logic]]]): At least one condition must be true
         not_ (Optional[Union[Condition, Logic]]): Negation of a single condition or logic group
     """
-    and_: Optional[List[Union["Condition", "Logic"]]] = None
-    or_: Optional[List[Union["Condition", "Logic"]]] = None
-    not_: Optional[Union["Condition", "Logic"]] = None
-
-    class Config:
-        # Field renaming to avoid conflict with Python keywords
-        fields = {
-            "and_": "and",
-            "or_": "or",
-            "not_": "not"
-        }
+    # Accept both the JSON keys ("and") and the Python field names ("and_")
+    model_config = ConfigDict(populate_by_name=True)
+
+    # Field aliases avoid conflict with Python keywords
+    and_: Optional[List[Union["Condition", "Logic"]]] = Field(default=None, alias="and")
+    or_: Optional[List[Union["Condition", "Logic"]]] = Field(default=None, alias="or")
+    not_: Optional[Union["Condition", "Logic"]] = Field(default=None, alias="not")
 
 class StrategyLogic(BaseModel):
     """
@@ -111,8 +107,8 @@ class StrategyRequest(BaseModel):
     symbols: List[str]
     interval: str
     strategy: StrategyLogic
-    execution: Optional[ExecutionParams] = ExecutionParams()
+    execution: Optional[ExecutionParams] = Field(default_factory=ExecutionParams)
 
 # Resolve forward references for recursive models
-StrategyLogic.update_forward_refs()
-Logic.update_forward_refs()
+StrategyLogic.model_rebuild()
+Logic.model_rebuild()
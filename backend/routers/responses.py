@@ -0,0 +1,59 @@
+"""
+Module: responses.py
+
+JSON response class shared by the API routers.
+
+Serializes payloads with orjson (written in Rust) instead of FastAPI's default
+`jsonable_encoder` + `json.dumps` path, which walks every object in Python. This
+matters for endpoints that return tens of thousands of OHLCV/signal records.
+
+Returning `FastJSONResponse(content)` from an endpoint bypasses `jsonable_encoder`
+entirely; values orjson does not handle natively (pandas Timestamps, NaT, NumPy
+scalars) are converted in `_default`, matching FastAPI's output format.
+"""
+
+from datetime import date, datetime
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi.responses import ORJSONResponse
+
+def _default(obj):
+    """
+    Fallback encoder for types orjson does not serialize natively.
+
+    Args:
+        obj: Object orjson could not encode.
+
+    Returns:
+        A JSON-compatible replacement (ISO string, None, or Python scalar).
+
+    Raises:
+        TypeError: If the object type is not supported.
+    """
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(content) -> bytes:
+    """
+    Serialize content to JSON bytes with the same rules as FastJSONResponse.
+    """
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also handles pandas/NumPy values found in DataFrame records.
+
+    NaN floats are emitted as null.
+    """
+    def render(self, content) -> bytes:
+        return dumps(content)
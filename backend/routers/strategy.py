@@ -11,13 +11,22 @@ Endpoints provided:
 Depends on:
 - schema.StrategyRequest for input validation
 - services.* modules for data processing, signal generation, and evaluation
+
+Multi-symbol requests are fanned out to a process pool, one symbol per task.
+The pool lives for the duration of the app (see `pool_lifespan`). Backtest
+results are streamed back per symbol as they complete.
 """
 
-import numpy as np
-from fastapi import APIRouter
-from backend.models.schema import StrategyRequest
-from backend.services.data_loader import load_ohlcv
-from backend.services.indicator_engine import add_indicators
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from backend.models.schema import StrategyRequest, ExecutionParams
+from backend.routers.responses import FastJSONResponse, dumps
+from backend.services.data_loader import load_ohlcv, get_indicatorized
 from backend.services.rule_engine import generate_signals
 from backend.services.execution_engine import simulate_trades
 from backend.services.performance_engine import calculate_metrics
@@ -25,6 +34,133 @@ from backend.services.performance_engine import calculate_metrics
 # Create FastAPI router for strategy-related routes
 router = APIRouter()
 
+# Worker processes for per-symbol pipelines, created and shut down by
+# `pool_lifespan`. Each worker keeps its own data_loader cache. None outside the
+# app's lifespan, in which case symbols run in the calling process.
+_pool = None
+
+@asynccontextmanager
+async def pool_lifespan(app):
+    """
+    FastAPI lifespan hook: run the per-symbol process pool while the app is up.
+
+    Workers use the spawn start method: forking the multithreaded server process
+    can deadlock (and matches `strategy_engine.backtest_all`). Workers start
+    lazily on first submit; shutting down on exit avoids leaking them on reload.
+    """
+    global _pool
+    _pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        yield
+    finally:
+        pool, _pool = _pool, None
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _map_symbols(fn, symbols, *args):
+    """
+    Run `fn(symbol, *args)` for every symbol and return a {symbol: result} dict.
+
+    Uses the process pool when there is more than one symbol; a single symbol
+    runs inline to avoid the cost of shipping its result between processes.
+    """
+    if len(symbols) <= 1 or _pool is None:
+        return {symbol: fn(symbol, *args) for symbol in symbols}
+    n = len(symbols)
+    results = _pool.map(fn, symbols, *([arg] * n for arg in args))
+    return dict(zip(symbols, results))
+
+def _clean_signals(df):
+    """
+    Make the signal columns plain booleans (missing values become False).
+
+    Only the columns that are actually returned are touched, rather than
+    scanning every OHLCV/indicator column for inf/NaN.
+    """
+    for col in ("entry_signal", "exit_signal"):
+        if df[col].dtype != bool:
+            df[col] = df[col].fillna(False).astype(bool)
+    return df
+
+def _signals_one(symbol: str, interval: str, strategy_dict: dict):
+    """
+    Indicator + signal pipeline for one symbol (top-level so it can be pickled).
+
+    Returns:
+        list[dict] | dict: Signal preview records, or {"error": ...} on failure.
+    """
+    try:
+        df = get_indicatorized(symbol, interval)  # OHLCV + technical indicators (cached)
+        df = df.dropna()         # Drop rows with missing indicator values
+        df = generate_signals(df, strategy_dict["entry"], strategy_dict["exit"])  # Apply entry/exit logic
+        df = _clean_signals(df)  # Sanitize the returned signal columns
+
+        return df[["timestamp", "entry_signal", "exit_signal"]].to_dict(orient="records")
+    except Exception as e:
+        return {"error": str(e)}
+
+def _backtest_one(symbol: str, interval: str, strategy_dict: dict, exec_dict: dict):
+    """
+    Full backtest pipeline for one symbol (top-level so it can be pickled).
+
+    Returns:
+        dict: preview/trades/metrics for the symbol, or {"error": ...} on failure.
+    """
+    try:
+        df = get_indicatorized(symbol, interval)  # Shared and never modified: masks can be memoized
+        df = generate_signals(df, strategy_dict["entry"], strategy_dict["exit"], memoize=True)
+        df = _clean_signals(df)
+
+        # Simulate trades
+        trades = simulate_trades(df, ExecutionParams(**exec_dict))
+
+        # Compute performance
+        metrics = calculate_metrics(df, trades)
+
+        return {
+            "preview": df[["timestamp", "entry_signal", "exit_signal"]].to_dict(orient="records"),
+            "trades": trades,
+            "metrics": metrics,
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+async def _stream_backtests(symbols, interval: str, strategy_dict: dict, exec_dict: dict, ndjson: bool):
+    """
+    Run per-symbol backtests concurrently and yield JSON fragments as each completes.
+
+    Yields either one NDJSON line per symbol ({symbol: result}), or the pieces of a
+    single JSON object ({"SYM": result, ...}) so the full response never has to be
+    held in memory at once.
+    """
+    loop = asyncio.get_running_loop()
+    # A single symbol (or no pool) runs in the default thread pool: no process
+    # hop, and the event loop stays free
+    executor = _pool if len(symbols) > 1 else None
+
+    async def run_one(symbol: str):
+        try:
+            result = await loop.run_in_executor(
+                executor, _backtest_one, symbol, interval, strategy_dict, exec_dict
+            )
+        except Exception as e:
+            result = {"error": str(e)}
+        return symbol, result
+
+    if not ndjson:
+        yield b"{"
+    first = True
+    for next_done in asyncio.as_completed([run_one(symbol) for symbol in symbols]):
+        symbol, result = await next_done
+        if ndjson:
+            yield dumps({symbol: result}) + b"\n"
+        else:
+            yield (b"" if first else b",") + dumps(symbol) + b":" + dumps(result)
+        first = False
+    if not ndjson:
+        yield b"}"
+
 @router.post("/strategy/load-data")
 def get_strategy_data(req: StrategyRequest):
     """
@@ -49,7 +185,7 @@ def get_strategy_data(req: StrategyRequest):
             result[symbol] = {"error": f"File not found for {symbol}_{req.interval}"}
         except Exception as e:
             result[symbol] = {"error": str(e)}
-    return result
+    return FastJSONResponse(result)
 
 @router.post("/strategy/run")
 def run_strategy(req: StrategyRequest):
@@ -65,22 +201,11 @@ def run_strategy(req: StrategyRequest):
     Returns:
         dict: A mapping from symbol to its signal preview or error message.
     """
-    result = {}
-    for symbol in req.symbols:
-        try:
-            df = load_ohlcv(symbol, req.interval)
-            df = add_indicators(df)  # Calculate technical indicators
-            df = df.dropna()         # Drop rows with missing indicator values
-            df = generate_signals(df, req.strategy.entry, req.strategy.exit)  # Apply entry/exit logic
-            df = df.replace([np.inf, -np.inf], np.nan).fillna(0)  # Replace invalid values
-
-            result[symbol] = df[["timestamp", "entry_signal", "exit_signal"]].to_dict(orient="records")
-        except Exception as e:
-            result[symbol] = {"error": str(e)}
-    return result
+    strategy_dict = req.strategy.model_dump(by_alias=True, exclude_none=True)
+    return FastJSONResponse(_map_symbols(_signals_one, req.symbols, req.interval, strategy_dict))
 
 @router.post("/strategy/backtest")
-def run_backtest(req: StrategyRequest):
+async def run_backtest(req: StrategyRequest, request: Request):
     """
     Endpoint: POST /strategy/backtest
 
@@ -91,34 +216,26 @@ def run_backtest(req: StrategyRequest):
         - Simulate trades based on signals and execution params
         - Calculate performance metrics
 
+    The response is streamed, one symbol at a time as results complete. Clients
+    sending `Accept: application/x-ndjson` receive one `{symbol: result}` JSON line
+    per symbol instead of a single JSON object.
+
     Args:
         req (StrategyRequest): Request object with strategy config, symbols, interval, logic, and execution params.
+        request (Request): Incoming HTTP request (used for content negotiation).
 
     Returns:
-        dict: A mapping from symbol to:
+        StreamingResponse: A mapping from symbol to:
             - preview: Entry/exit signals
             - trades: Executed trades list
             - metrics: Performance summary (e.g., Sharpe ratio, total return, win rate)
     """
-    final_result = {}
-    for symbol in req.symbols:
-        try:
-            df = load_ohlcv(symbol, req.interval)
-            df = add_indicators(df)
-            df = generate_signals(df, req.strategy.entry, req.strategy.exit)
-            df = df.replace([np.inf, -np.inf], np.nan).fillna(0)
-
-            # Simulate trades
-            trades = simulate_trades(df, req.execution)
-
-            # Compute performance
-            metrics = calculate_metrics(df, trades)
-
-            final_result[symbol] = {
-                "preview": df[["timestamp", "entry_signal", "exit_signal"]].to_dict(orient="records"),
-                "trades": trades,
-                "metrics": metrics,
-            }
-        except Exception as e:
-            final_result[symbol] = {"error": str(e)}
-    return final_result
+    symbols = list(dict.fromkeys(req.symbols))  # De-duplicate, keep order
+    strategy_dict = req.strategy.model_dump(by_alias=True, exclude_none=True)
+    exec_dict = (req.execution or ExecutionParams()).model_dump()
+    ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+
+    return StreamingResponse(
+        _stream_backtests(symbols, req.interval, strategy_dict, exec_dict, ndjson),
+        media_type="application/x-ndjson" if ndjson else "application/json",
+    )
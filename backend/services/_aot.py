@@ -0,0 +1,69 @@
+"""
+Module: _aot.py
+
+Loads the ahead-of-time built kernel module `backend/services/fastkernels`
+(see `_aot_build.py`) for an engine module, if it is safe to use.
+
+The build stamps each engine module's source hash into the extension. A kernel
+module built from older source (e.g. before an edit to `_simulate_trades_nb`)
+would silently keep running the old math, so on a mismatch the engine falls back
+to its `@njit` kernels and a warning is logged.
+
+Functions:
+- source_hash(): Hash of a module's current source code.
+- load_kernels(): The `fastkernels` module, if built from the current source.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+def source_hash(module_name: str) -> int:
+    """
+    Hash a module's source code into a non-negative int64 (first 60 bits of SHA-1).
+
+    Args:
+        module_name (str): Dotted module name, e.g. "backend.services.execution_engine".
+
+    Returns:
+        int: Source hash.
+    """
+    module = sys.modules.get(module_name)
+    spec = module.__spec__ if module is not None else importlib.util.find_spec(module_name)
+    source = spec.loader.get_source(module_name)
+    return int(hashlib.sha1(source.encode()).hexdigest()[:15], 16)
+
+def hash_export_name(module_name: str) -> str:
+    """
+    Name of the `fastkernels` function returning the source hash a module was built from.
+    """
+    return f"{module_name.rsplit('.', 1)[-1]}_source_hash"
+
+def load_kernels(module_name: str):
+    """
+    Return the `fastkernels` extension if its kernels for `module_name` are current.
+
+    Args:
+        module_name (str): Engine module asking for its kernels (pass `__name__`).
+
+    Returns:
+        module | None: The extension module, or None if it isn't built or was built
+            from different source.
+    """
+    try:
+        from backend.services import fastkernels
+    except ImportError:
+        return None
+
+    built_hash = getattr(fastkernels, hash_export_name(module_name), None)
+    if built_hash is None or built_hash() != source_hash(module_name):
+        logger.warning(
+            "fastkernels was built from different %s source; using the JIT kernels "
+            "(rebuild with `python -m backend.services._aot_build`)",
+            module_name,
+        )
+        return None
+    return fastkernels
@@ -0,0 +1,67 @@
+"""
+Module: _aot_build.py
+
+Ahead-of-time (AOT) build of the Numba kernels used on the backtest hot path.
+
+`@njit(cache=True)` still compiles each kernel once per machine, and each worker
+process pays the cache load. Running this script produces a native extension
+module, `backend/services/fastkernels`, so workers can import pre-built kernels
+with no JIT step at all. The engine modules use it when present and fall back to
+their `@njit` kernels otherwise.
+
+Kernels are compiled from the same Python source as the JIT versions (`py_func`),
+for fixed argument types. Kernels that accept float32 or float64 prices are
+exported once per dtype (`_f4` / `_f8` suffix). Each engine module's source hash
+is exported too (`<module>_source_hash`), so an extension built before a later
+edit is detected and ignored (see `_aot.load_kernels`); rebuild after editing.
+
+Usage (from the repository root, e.g. during setup or CI):
+    python -m backend.services._aot_build
+"""
+
+import os
+from numba.pycc import CC
+from backend.services._aot import hash_export_name, source_hash
+from backend.services.execution_engine import _simulate_trades_nb
+from backend.services.indicator_engine import _fused_indicators
+from backend.services.performance_engine import _price_stats
+
+cc = CC("fastkernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.verbose = True
+
+def _constant(value):
+    """
+    Zero-argument function returning `value` (frozen into the compiled code).
+    """
+    def get():
+        return value
+    return get
+
+# Source hash per engine module, checked against the source on import
+for kernel in (_simulate_trades_nb, _fused_indicators, _price_stats):
+    module_name = kernel.py_func.__module__
+    cc.export(hash_export_name(module_name), "i8()")(_constant(source_hash(module_name)))
+
+# (ts, close, entry_sig, exit_sig, buy_mult, sell_mult, fee_in, fee_out, sl, tp)
+#   -> (entry_idx, exit_idx, entry_px, exit_px, pnl, reason)
+cc.export(
+    "simulate_trades_nb",
+    "Tuple((i8[:], i8[:], f8[:], f8[:], f8[:], i1[:]))(i8[:], f8[:], b1[:], b1[:], f8, f8, f8, f8, f8, f8)",
+)(_simulate_trades_nb.py_func)
+
+for suffix, dtype in (("f4", "f4"), ("f8", "f8")):
+    # (close, a20, a50, a12, a26, a9, a14) -> (ema_20, ema_50, rsi_14, macd, macd_signal)
+    cc.export(
+        f"fused_indicators_{suffix}",
+        f"UniTuple(f8[:], 5)({dtype}[:], f8, f8, f8, f8, f8, f8)",
+    )(_fused_indicators.py_func)
+
+    # close -> (returns, mean, std, downside_std, max_drawdown)
+    cc.export(
+        f"price_stats_{suffix}",
+        f"Tuple((f8[:], f8, f8, f8, f8))({dtype}[:])",
+    )(_price_stats.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -5,23 +5,228 @@ This module provides functionality to load OHLCV (Open-High-Low-Close-Volume)
 data for a given trading symbol and interval from CSV files stored in the 
 backend/data directory.
 
-It includes caching to avoid re-reading the same files repeatedly, and ensures 
+It includes caching to avoid re-reading the same files repeatedly (an LRU bounded
+by CACHE_MAX_BYTES and invalidated when a CSV changes), and ensures 
 column names are standardized for further processing in the pipeline.
+
+Parsed CSVs are also written to a parquet cache under backend/data/.cache so
+later process starts can skip CSV parsing entirely.
+
+`get_indicatorized()` additionally caches the indicator-enhanced frame per
+(symbol, interval), since indicators depend only on the static OHLCV data. It
+shares the same LRU and byte budget as the raw frames.
 """
 
 import os
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
+from backend.services.indicator_engine import add_indicators
+
+# Path to CSV file directory
+DATA_DIR = "backend/data"
+
+# In-memory LRU cache for loaded and indicator-enhanced DataFrames, to reduce
+# file I/O and recomputation: key -> (source mtime, size in bytes, DataFrame),
+# least recently used first
+_cache = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+# Memory budget for `_cache` (per process); least recently used frames are evicted beyond it
+CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+# On-disk cache of parsed CSVs (typed, columnar parquet files)
+CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+
+# Part of each parquet cache file name; bump when the cached columns or dtypes
+# change, so files written by older versions are ignored
+PARQUET_CACHE_VERSION = 2
+
+# Index of available CSVs: (symbol, interval) -> file path (lowercase keys)
+_file_index = {}
+
+# Explicit dtypes for the OHLCV columns so the CSV parser skips type inference.
+# float32 carries ~7 significant digits, ample for prices, and halves the bytes
+# streamed through indicator and metric computations.
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+CSV_DTYPES = {
+    "Open": "float32",
+    "High": "float32",
+    "Low": "float32",
+    "Close": "float32",
+    "Volume": "float32",
+    # Kept as the CSV's text (pyarrow would otherwise infer datetime64), so API
+    # responses keep returning e.g. "2020-01-01 00:00:00"
+    "Close time": "str",
+}
+
+def _to_float32(df: pd.DataFrame) -> None:
+    """
+    Cast OHLCV price/volume columns to float32 in place (no-op if already float32).
+    """
+    for c in OHLCV_COLUMNS:
+        if c in df.columns and df[c].dtype != np.float32:
+            df[c] = df[c].astype(np.float32)
+
+def parse_filename(file_name: str):
+    """
+    Parses filenames like: 'btc_1d_data_2018_to_2025.csv'
+
+    Extracts:
+        - Symbol (e.g., 'btc')
+        - Interval (e.g., '1d')
+
+    Args:
+        file_name (str): The name of the CSV file.
+
+    Returns:
+        tuple: (symbol, interval) if parsed successfully, otherwise (None, None)
+    """
+    # partition() avoids building a list of every '_'-separated part
+    symbol, _, rest = file_name.partition("_")
+    interval, sep, _ = rest.partition("_")
+    if sep:  # At least three parts: {symbol}_{interval}_...
+        return symbol, interval
+    return None, None
+
+def _scan_data_dir() -> dict:
+    """
+    Scan DATA_DIR once and map (symbol, interval) to the matching CSV path.
+
+    Files are matched on their '{symbol}_{interval}' prefix, so both
+    'btcusdt_1h.csv' and 'btc_1d_data_2018_to_2025.csv' are indexed. When
+    several files share a prefix, the first in sorted order wins.
+
+    Returns:
+        dict: {(symbol, interval): path} with lowercase keys.
+    """
+    index = {}
+    if not os.path.isdir(DATA_DIR):
+        return index
+
+    with os.scandir(DATA_DIR) as it:
+        names = sorted(e.name for e in it if e.is_file() and e.name.endswith(".csv"))
+
+    for name in names:
+        # Append a separator so '{symbol}_{interval}.csv' parses like the long form
+        symbol, interval = parse_filename(name[:-len(".csv")] + "_")
+        if symbol and interval:
+            index.setdefault((symbol.lower(), interval.lower()), os.path.join(DATA_DIR, name))
+    return index
+
+def _cache_get(key, mtime: float):
+    """
+    Return the cached DataFrame for `key` if it was loaded from this source mtime.
+    """
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None or entry[0] != mtime:
+            return None
+        _cache.move_to_end(key)
+        return entry[2]
+
+def _cache_put(key, mtime: float, df: pd.DataFrame) -> None:
+    """
+    Cache a loaded DataFrame, evicting least recently used frames over CACHE_MAX_BYTES.
+
+    The most recent frame is always kept, even if it alone exceeds the budget.
+    """
+    global _cache_bytes
+    nbytes = int(df.memory_usage(deep=True).sum())
+    with _cache_lock:
+        old = _cache.pop(key, None)
+        if old is not None:
+            _cache_bytes -= old[1]
+        _cache[key] = (mtime, nbytes, df)
+        _cache_bytes += nbytes
+
+        while _cache_bytes > CACHE_MAX_BYTES and len(_cache) > 1:
+            _, (_, evicted_bytes, _) = _cache.popitem(last=False)
+            _cache_bytes -= evicted_bytes
+
+def refresh_index() -> None:
+    """
+    Rebuild the (symbol, interval) -> file index, e.g. after adding new CSVs.
+    """
+    global _file_index
+    _file_index = _scan_data_dir()
+
+def _locate(symbol: str, interval: str, exchange: str = None):
+    """
+    Resolve the source CSV and parquet cache paths for a symbol/interval.
+
+    With an exchange, the file must be named exactly '{exchange}_{symbol}_{interval}.csv'.
+
+    Returns:
+        tuple: (csv_path, parquet_cache_path)
 
-# In-memory cache for loaded DataFrames to reduce file I/O
-_cache = {}
+    Raises:
+        FileNotFoundError: If no matching CSV file is found in the backend/data directory.
+    """
+    if exchange is not None:
+        name = f"{exchange}_{symbol}_{interval}"
+        file_path = os.path.join(DATA_DIR, f"{name}.csv")
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"No file found for {name}")
+        return file_path, _parquet_path(name.lower())
+
+    # Normalize to lowercase to match file naming convention
+    filename_prefix = f"{symbol.lower()}_{interval.lower()}"
+    index_key = (symbol.lower(), interval.lower())
+
+    # Look up the file in the prebuilt index, rescanning once in case it was just added
+    file_path = _file_index.get(index_key)
+    if file_path is None:
+        refresh_index()
+        file_path = _file_index.get(index_key)
+
+    if file_path is None:
+        raise FileNotFoundError(f"No file found for {symbol}_{interval}")
+
+    return file_path, _parquet_path(filename_prefix)
+
+def _parquet_path(name: str) -> str:
+    """
+    Path of the parquet cache file for a (lowercase) dataset name.
+    """
+    return os.path.join(CACHE_DIR, f"{name}.v{PARQUET_CACHE_VERSION}.parquet")
+
+def _write_parquet(df: pd.DataFrame, cache_path: str) -> None:
+    """
+    Write the parquet cache atomically: to a unique temp file, then renamed into place.
+
+    Other threads and worker processes check the cache by mtime only, so they
+    must never see a partially written file.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            df.to_parquet(f, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
-def load_ohlcv(symbol: str, interval: str) -> pd.DataFrame:
+def _cache_is_fresh(file_path: str, cache_path: str) -> bool:
+    """
+    True if the parquet cache exists and is at least as new as the CSV.
+    """
+    return os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path)
+
+def load_ohlcv(symbol: str, interval: str, *, exchange: str = None) -> pd.DataFrame:
     """
     Load OHLCV data for a given symbol and interval from the local CSV file.
 
     Parameters:
         symbol (str): Trading symbol, e.g., "BTCUSDT"
         interval (str): Time interval, e.g., "1h", "5m", etc.
+        exchange (str): Optional exchange prefix, for files named
+                        '{exchange}_{symbol}_{interval}.csv' (e.g. "binance").
+                        Keyword-only.
 
     Returns:
         pd.DataFrame: Cleaned OHLCV data with standardized column names and sorted timestamps.
@@ -32,26 +237,24 @@ def load_ohlcv(symbol: str, interval: str) -> pd.DataFrame:
     Example:
         df = load_ohlcv("BTCUSDT", "1h")
     """
-    key = f"{symbol}_{interval}"
-    
-    # Return from cache if already loaded
-    if key in _cache:
-        return _cache[key]
+    key = f"{symbol}_{interval}" if exchange is None else f"{exchange}_{symbol}_{interval}"
+    file_path, cache_path = _locate(symbol, interval, exchange)
+    mtime = os.stat(file_path).st_mtime
 
-    # Normalize to lowercase to match file naming convention
-    filename_prefix = f"{symbol.lower()}_{interval.lower()}"
+    # Return from cache if already loaded and the CSV is unchanged since
+    df = _cache_get(key, mtime)
+    if df is not None:
+        return df
 
-    # Look for matching file in data directory
-    files = os.listdir("backend/data")
-    matched = [f for f in files if f.startswith(filename_prefix) and f.endswith(".csv")]
-
-    if not matched:
-        raise FileNotFoundError(f"No file found for {symbol}_{interval}")
-
-    file_path = os.path.join("backend/data", matched[0])
+    # Reuse the parquet cache unless the CSV has been modified since it was written
+    if _cache_is_fresh(file_path, cache_path):
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+        _to_float32(df)
+        _cache_put(key, mtime, df)
+        return df
 
     # Read CSV into DataFrame
-    df = pd.read_csv(file_path)
+    df = pd.read_csv(file_path, engine="pyarrow", dtype=CSV_DTYPES, parse_dates=["Open time"])
 
     # Rename columns to standard format expected by the pipeline
     df.rename(columns={
@@ -63,11 +266,52 @@ def load_ohlcv(symbol: str, interval: str) -> pd.DataFrame:
         "Volume": "volume"
     }, inplace=True)
 
-    # Convert timestamp to datetime and sort
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    # Normalize timestamp resolution (pyarrow parses to ms) and sort
+    df["timestamp"] = df["timestamp"].astype("datetime64[ns]")
+    _to_float32(df)
     df = df.sort_values("timestamp")
 
+    # Persist parsed data so future cold starts skip CSV parsing
+    try:
+        _write_parquet(df, cache_path)
+    except OSError:
+        pass  # Cache is an optimization only; a read-only data dir is fine
+
     # Cache for future use
-    _cache[key] = df
+    _cache_put(key, mtime, df)
 
     return df
+
+def get_indicatorized(symbol: str, interval: str) -> pd.DataFrame:
+    """
+    Load OHLCV data with technical indicators added, reusing a cached result.
+
+    The cached frame is invalidated when the source CSV's modification time
+    changes. It is shared between callers, so treat it as read-only.
+
+    Parameters:
+        symbol (str): Trading symbol, e.g., "BTCUSDT"
+        interval (str): Time interval, e.g., "1h", "5m", etc.
+
+    Returns:
+        pd.DataFrame: OHLCV data with indicator columns (see `add_indicators`).
+
+    Raises:
+        FileNotFoundError: If no matching CSV file is found in the backend/data directory.
+    """
+    index_key = (symbol.lower(), interval.lower())
+    df = load_ohlcv(symbol, interval)
+    mtime = os.stat(_file_index[index_key]).st_mtime
+
+    # load_ohlcv already reloads a changed CSV; recompute indicators to match
+    key = ("indicators",) + index_key
+    cached = _cache_get(key, mtime)
+    if cached is not None:
+        return cached
+
+    df = add_indicators(df)
+    _cache_put(key, mtime, df)
+    return df
+
+# Build the file index once at import
+refresh_index()
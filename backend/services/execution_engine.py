@@ -4,15 +4,272 @@ Module: execution_engine.py
 Simulates the execution of trades based on entry and exit signals, accounting for
 slippage, fees, stop-loss, and take-profit constraints.
 
-Core function:
+Core functions:
 - simulate_trades(df, exec_params): Generates trade records using configured execution parameters.
+- simulate_trades_2d(...): Same simulation for several timestamp-aligned symbols in one parallel pass.
 
 Used in:
 - POST /strategy/backtest endpoint
 """
 
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 from backend.models.schema import ExecutionParams
+from backend.services._aot import load_kernels
+
+# Pre-built kernel from `python -m backend.services._aot_build`, if built from this source
+_aot = load_kernels(__name__)
+_simulate_trades_aot = _aot.simulate_trades_nb if _aot is not None else None
+
+# Exit reason codes emitted by the compiled kernel
+REASON_TP = 0
+REASON_SL = 1
+REASON_SIGNAL = 2
+_REASON_LABELS = ("tp", "sl", "exit_signal")
+
+# Integer representation of NaT when timestamps are viewed as int64 nanoseconds
+_NAT = np.iinfo(np.int64).min
+
+# Use the vectorized exit search when entries make up at most this share of bars
+SPARSE_SIGNAL_RATIO = 0.01
+
+# Initial look-ahead window (in bars) when searching for the next exit
+_EXIT_SEARCH_WINDOW = 64
+
+@njit(cache=True)
+def _simulate_trades_nb(ts, close, entry_sig, exit_sig, buy_mult, sell_mult, fee_in, fee_out, sl, tp):
+    """
+    Compiled trade simulation loop over contiguous NumPy arrays.
+
+    Args:
+        ts (np.ndarray[int64]): Timestamps as int64 nanoseconds (NaT rows are skipped).
+        close (np.ndarray[float64]): Close prices (NaN rows are skipped).
+        entry_sig (np.ndarray[bool]): Entry signal per bar.
+        exit_sig (np.ndarray[bool]): Exit signal per bar.
+        buy_mult, sell_mult, fee_in, fee_out, sl, tp (float): Execution settings
+            from `_kernel_params`.
+
+    Returns:
+        tuple: (entry_idx, exit_idx, entry_price, exit_price, pnl_pct, reason) arrays,
+               each truncated to the number of completed trades.
+    """
+    n = close.shape[0]
+    use_sl = sl != 0.0
+    use_tp = tp != 0.0
+
+    # A trade needs at least two bars (entry and exit), so n // 2 is an upper bound
+    cap = n // 2
+    entry_idx = np.empty(cap, dtype=np.int64)
+    exit_idx = np.empty(cap, dtype=np.int64)
+    entry_px = np.empty(cap, dtype=np.float64)
+    exit_px = np.empty(cap, dtype=np.float64)
+    pnl = np.empty(cap, dtype=np.float64)
+    reason = np.empty(cap, dtype=np.int8)
+    k = 0
+
+    in_trade = False
+    ep = 0.0
+    ei = 0
+    stop_price = 0.0
+    target_price = 0.0
+
+    for i in range(n):
+        price = close[i]
+        if np.isnan(price) or ts[i] == _NAT:
+            continue  # Skip rows with missing critical data
+
+        # ---- Entry Logic ----
+        if not in_trade:
+            if entry_sig[i]:
+                in_trade = True
+                ep = price * buy_mult
+                ei = i
+                stop_price = ep * (1.0 - sl)
+                target_price = ep * (1.0 + tp)
+            continue
+
+        # ---- Exit Logic ----
+        hit_tp = use_tp and price >= target_price
+        hit_sl = use_sl and price <= stop_price
+        if exit_sig[i] or hit_tp or hit_sl:
+            xp = price * sell_mult
+
+            # Account for round-trip fees
+            net_entry = ep * fee_in
+            net_exit = xp * fee_out
+
+            entry_idx[k] = ei
+            exit_idx[k] = i
+            entry_px[k] = ep
+            exit_px[k] = xp
+            pnl[k] = ((net_exit - net_entry) / net_entry) * 100.0
+            reason[k] = REASON_TP if hit_tp else REASON_SL if hit_sl else REASON_SIGNAL
+            k += 1
+            in_trade = False
+
+    return entry_idx[:k], exit_idx[:k], entry_px[:k], exit_px[:k], pnl[:k], reason[:k]
+
+def _simulate_trades_sparse(ts, close, entry_sig, exit_sig, buy_mult, sell_mult, fee_in, fee_out, sl, tp):
+    """
+    Vectorized trade simulation for sparse entry signals.
+
+    Instead of visiting every bar, jumps from one entry to the next and locates
+    each exit with a NumPy mask search over the bars that follow the entry. The
+    search window doubles until an exit is found, so each trade only scans
+    roughly as many bars as it stays open.
+
+    Takes the same arguments and returns the same arrays as `_simulate_trades_nb`.
+    """
+    n = close.shape[0]
+    use_sl = sl != 0.0
+    use_tp = tp != 0.0
+
+    valid = ~np.isnan(close) & (ts != _NAT)
+    entries = np.flatnonzero(entry_sig & valid)
+
+    entry_idx, exit_idx, entry_px, exit_px, pnl, reason = [], [], [], [], [], []
+    cur = 0
+
+    for e in entries:
+        if e < cur:
+            continue  # Still inside the previous trade
+
+        ep = close[e] * buy_mult
+        tp_px = ep * (1.0 + tp)
+        sl_px = ep * (1.0 - sl)
+
+        # ---- Find the first exit bar after entry ----
+        x = -1
+        start = e + 1
+        window = _EXIT_SEARCH_WINDOW
+        while start < n:
+            stop = min(start + window, n)
+            seg = close[start:stop]
+            mask = exit_sig[start:stop].copy()
+            if use_tp:
+                mask |= seg >= tp_px
+            if use_sl:
+                mask |= seg <= sl_px
+            mask &= valid[start:stop]
+            j = mask.argmax()
+            if mask[j]:
+                x = start + j
+                break
+            start = stop
+            window *= 2
+
+        if x < 0:
+            break  # Trade is still open at the end of the data
+
+        price = close[x]
+        xp = price * sell_mult
+
+        # Account for round-trip fees
+        net_entry = ep * fee_in
+        net_exit = xp * fee_out
+
+        hit_tp = use_tp and price >= tp_px
+        hit_sl = use_sl and price <= sl_px
+
+        entry_idx.append(e)
+        exit_idx.append(x)
+        entry_px.append(ep)
+        exit_px.append(xp)
+        pnl.append(((net_exit - net_entry) / net_entry) * 100.0)
+        reason.append(REASON_TP if hit_tp else REASON_SL if hit_sl else REASON_SIGNAL)
+        cur = x + 1
+
+    return (
+        np.asarray(entry_idx, dtype=np.int64),
+        np.asarray(exit_idx, dtype=np.int64),
+        np.asarray(entry_px, dtype=np.float64),
+        np.asarray(exit_px, dtype=np.float64),
+        np.asarray(pnl, dtype=np.float64),
+        np.asarray(reason, dtype=np.int8),
+    )
+
+@njit(cache=True, parallel=True)
+def _simulate_trades_2d(ts, closes, entry_sig, exit_sig, buy_mult, sell_mult, fee_in, fee_out, sl, tp):
+    """
+    Run `_simulate_trades_nb` over every column of (n_bars, n_symbols) matrices.
+
+    All symbols share the timestamp array `ts`; columns are simulated in parallel.
+
+    Returns:
+        tuple: (counts, entry_idx, exit_idx, entry_price, exit_price, pnl_pct, reason),
+               where `counts[j]` is the number of trades for symbol j and each other
+               array has shape (n_symbols, n_bars // 2) with row j valid up to counts[j].
+    """
+    n, m = closes.shape
+    cap = n // 2
+    counts = np.zeros(m, dtype=np.int64)
+    entry_idx = np.empty((m, cap), dtype=np.int64)
+    exit_idx = np.empty((m, cap), dtype=np.int64)
+    entry_px = np.empty((m, cap), dtype=np.float64)
+    exit_px = np.empty((m, cap), dtype=np.float64)
+    pnl = np.empty((m, cap), dtype=np.float64)
+    reason = np.empty((m, cap), dtype=np.int8)
+
+    for j in prange(m):
+        ei, xi, ep, xp, pp, rs = _simulate_trades_nb(
+            ts, closes[:, j], entry_sig[:, j], exit_sig[:, j],
+            buy_mult, sell_mult, fee_in, fee_out, sl, tp,
+        )
+        k = pp.shape[0]
+        counts[j] = k
+        entry_idx[j, :k] = ei
+        exit_idx[j, :k] = xi
+        entry_px[j, :k] = ep
+        exit_px[j, :k] = xp
+        pnl[j, :k] = pp
+        reason[j, :k] = rs
+
+    return counts, entry_idx, exit_idx, entry_px, exit_px, pnl, reason
+
+def _kernel_params(exec_params: ExecutionParams) -> tuple:
+    """
+    Execution settings as the kernels' scalar arguments, computed once per call.
+
+    Returns:
+        tuple: (buy_mult, sell_mult, fee_in, fee_out, sl, tp): price multipliers for
+               slippage (buy above, sell below) and round-trip fees, then stop loss
+               and take profit as fractions (0 disables them).
+    """
+    slip = float(exec_params.slippage_bps) * 1e-4
+    fee = float(exec_params.fee_bps) * 1e-4
+    return (
+        1.0 + slip,
+        1.0 - slip,
+        1.0 + fee,
+        1.0 - fee,
+        float(exec_params.stop_loss_pct or 0.0) * 0.01,
+        float(exec_params.take_profit_pct or 0.0) * 0.01,
+    )
+
+def _trade_records(timestamps, entry_idx, exit_idx, entry_px, exit_px, pnl, reason) -> list:
+    """
+    Convert kernel output arrays into the trade dicts returned by the API.
+    """
+    return [
+        {
+            "entry_time": pd.Timestamp(timestamps[entry_idx[k]]),
+            "entry_price": round(float(entry_px[k]), 2),
+            "exit_time": pd.Timestamp(timestamps[exit_idx[k]]),
+            "exit_price": round(float(exit_px[k]), 2),
+            "pnl_pct": round(float(pnl[k]), 2),
+            "reason": _REASON_LABELS[reason[k]],
+        }
+        for k in range(len(pnl))
+    ]
+
+def _signal_array(df, col: str, n: int) -> np.ndarray:
+    """
+    Extract a signal column as a boolean array, treating a missing column as all False.
+    """
+    if col not in df:
+        return np.zeros(n, dtype=np.bool_)
+    return np.ascontiguousarray(np.asarray(df[col], dtype=np.bool_))
 
 def simulate_trades(df: pd.DataFrame, exec_params: ExecutionParams):
     """
@@ -24,6 +281,8 @@ def simulate_trades(df: pd.DataFrame, exec_params: ExecutionParams):
         - hitting stop loss (SL)
 
     Slippage and trading fees are applied to both entry and exit prices.
+    The bar-by-bar walk itself runs in a Numba-compiled kernel over NumPy arrays;
+    when entry signals are sparse, exits are located with a vectorized search instead.
 
     Args:
         df (pd.DataFrame): DataFrame containing timestamped OHLCV data and entry/exit signals.
@@ -36,80 +295,60 @@ def simulate_trades(df: pd.DataFrame, exec_params: ExecutionParams):
             - pnl_pct (net % return)
             - reason (tp/sl/exit_signal)
     """
-    trades = []
-    in_trade = False
-    entry_price = None
-    entry_time = None
-    stop_price = None
-    target_price = None
+    close = np.ascontiguousarray(np.asarray(df["close"], dtype=np.float64))
+    timestamps = np.asarray(df["timestamp"], dtype="datetime64[ns]")
+    ts = np.ascontiguousarray(timestamps.view("i8"))
+    entry_sig = _signal_array(df, "entry_signal", len(close))
+    exit_sig = _signal_array(df, "exit_signal", len(close))
 
-    for i, row in df.iterrows():
-        if pd.isna(row["close"]) or pd.isna(row["timestamp"]):
-            continue  # Skip rows with missing critical data
+    # Sparse signals: jump between entries rather than walking every bar
+    n_entries = np.count_nonzero(entry_sig)
+    simulate = (
+        _simulate_trades_sparse
+        if n_entries <= SPARSE_SIGNAL_RATIO * len(close)
+        else _simulate_trades_aot or _simulate_trades_nb
+    )
 
-        price = row["close"]
+    entry_idx, exit_idx, entry_px, exit_px, pnl, reason = simulate(
+        ts, close, entry_sig, exit_sig, *_kernel_params(exec_params)
+    )
 
-        def apply_slippage(p: float, side: str) -> float:
-            """
-            Apply slippage to price based on trade side.
+    return _trade_records(timestamps, entry_idx, exit_idx, entry_px, exit_px, pnl, reason)
 
-            Args:
-                p (float): Raw price
-                side (str): 'buy' or 'sell'
+def simulate_trades_2d(timestamps, closes, entry_sig, exit_sig, exec_params: ExecutionParams) -> list:
+    """
+    Simulate trades for several symbols that share the same bar timestamps.
 
-            Returns:
-                float: Adjusted price after slippage
-            """
-            slip = (exec_params.slippage_bps / 10000) * p
-            return p + slip if side == "buy" else p - slip
+    Equivalent to calling `simulate_trades` once per column, but all symbols are
+    simulated in a single parallel kernel call.
 
-        # ---- Entry Logic ----
-        if not in_trade and row.get("entry_signal", False):
-            in_trade = True
-            entry_price = apply_slippage(price, "buy")
-            entry_time = row["timestamp"]
-
-            stop_price = (
-                entry_price * (1 - exec_params.stop_loss_pct / 100)
-                if exec_params.stop_loss_pct else None
-            )
-            target_price = (
-                entry_price * (1 + exec_params.take_profit_pct / 100)
-                if exec_params.take_profit_pct else None
-            )
-            continue
+    Args:
+        timestamps (array-like): Shared bar timestamps, length n_bars.
+        closes (np.ndarray): (n_bars, n_symbols) close price matrix.
+        entry_sig (np.ndarray): (n_bars, n_symbols) boolean entry signals.
+        exit_sig (np.ndarray): (n_bars, n_symbols) boolean exit signals.
+        exec_params (ExecutionParams): Execution settings applied to every symbol.
 
-        # ---- Exit Logic ----
-        if in_trade:
-            exit_signal = row.get("exit_signal", False)
-            hit_tp = target_price is not None and price >= target_price
-            hit_sl = stop_price is not None and price <= stop_price
-
-            if exit_signal or hit_tp or hit_sl:
-                exit_price = apply_slippage(price, "sell")
-                exit_time = row["timestamp"]
-
-                # Account for round-trip fees
-                fee_pct = exec_params.fee_bps / 10000
-                net_entry = entry_price * (1 + fee_pct)
-                net_exit = exit_price * (1 - fee_pct)
-
-                pnl_pct = ((net_exit - net_entry) / net_entry) * 100
-
-                trades.append({
-                    "entry_time": entry_time,
-                    "entry_price": round(entry_price, 2),
-                    "exit_time": exit_time,
-                    "exit_price": round(exit_price, 2),
-                    "pnl_pct": round(pnl_pct, 2),
-                    "reason": "tp" if hit_tp else "sl" if hit_sl else "exit_signal"
-                })
-
-                # Reset trade state
-                in_trade = False
-                entry_price = None
-                entry_time = None
-                stop_price = None
-                target_price = None
-
-    return trades
+    Returns:
+        List[List[dict]]: Trade records per symbol, in column order.
+    """
+    timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+    ts = np.ascontiguousarray(timestamps.view("i8"))
+    # Column-major layout keeps each symbol's series contiguous for the kernel
+    closes = np.asfortranarray(closes, dtype=np.float64)
+    entry_sig = np.asfortranarray(entry_sig, dtype=np.bool_)
+    exit_sig = np.asfortranarray(exit_sig, dtype=np.bool_)
+
+    counts, entry_idx, exit_idx, entry_px, exit_px, pnl, reason = _simulate_trades_2d(
+        ts, closes, entry_sig, exit_sig, *_kernel_params(exec_params)
+    )
+
+    return [
+        _trade_records(
+            timestamps,
+            entry_idx[j, :k], exit_idx[j, :k],
+            entry_px[j, :k], exit_px[j, :k],
+            pnl[j, :k], reason[j, :k],
+        )
+        for j, k in enumerate(counts)
+    ]
@@ -3,18 +3,165 @@ Module: indicator_engine.py
 
 Provides functions to compute technical indicators used in strategy logic and signal generation.
 
-Uses the `ta` (Technical Analysis) Python package to calculate:
+Calculates, in a single fused Numba pass over the close prices:
 - Exponential Moving Averages (EMA)
 - Relative Strength Index (RSI)
 - MACD and MACD Signal Line
 
+Values match the `ta` (Technical Analysis) package definitions, which are built on
+pandas' `ewm(adjust=False)`.
+
+`add_indicators` works on one symbol's frame; `indicators_2d` computes the same
+set for a (n_bars, n_symbols) price matrix in one parallel pass.
+
 This module is intended to be applied to OHLCV data prior to rule-based logic evaluation.
 """
 
+import numpy as np
 import pandas as pd
-import ta  # type: ignore
-from ta.trend import EMAIndicator, MACD  # type: ignore
-from ta.momentum import RSIIndicator     # type: ignore
+from numba import njit, prange
+from backend.services._aot import load_kernels
+
+# Pre-built kernels from `python -m backend.services._aot_build`, if built from this source
+_aot = load_kernels(__name__)
+
+def _ewm_com(span=None, alpha=None) -> float:
+    """
+    Convert an EWM span or alpha to center of mass, as pandas does.
+    """
+    if span is not None:
+        return (span - 1) / 2.0
+    return (1 - alpha) / alpha
+
+@njit(cache=True, inline="always")
+def _ewm_step(weighted, old_wt, nobs, cur, alpha, minp):
+    """
+    Advance one step of pandas' `ewm(adjust=False, ignore_na=False).mean()`.
+
+    Returns:
+        tuple: (weighted, old_wt, nobs, output value for this step)
+    """
+    is_obs = cur == cur
+    nobs += is_obs
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if is_obs:
+            # Skip the update on constant input to avoid rounding drift (as pandas does)
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif is_obs:
+        weighted = cur
+    out = weighted if nobs >= minp else np.nan
+    return weighted, old_wt, nobs, out
+
+@njit(cache=True)
+def _fused_indicators(close, a20, a50, a12, a26, a9, a14):
+    """
+    Compute EMA20, EMA50, RSI14, MACD(12/26) and MACD signal(9) in one pass.
+
+    Each close price is read once; all running EMA states are updated together.
+
+    Args:
+        close (np.ndarray): Close prices (float32 or float64).
+        a20, a50, a12, a26, a9, a14 (float): Smoothing factors for each EMA stream.
+
+    Returns:
+        tuple: (ema_20, ema_50, rsi_14, macd, macd_signal) float64 arrays.
+    """
+    n = close.shape[0]
+    ema_20 = np.empty(n, dtype=np.float64)
+    ema_50 = np.empty(n, dtype=np.float64)
+    rsi_14 = np.empty(n, dtype=np.float64)
+    macd = np.empty(n, dtype=np.float64)
+    macd_signal = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return ema_20, ema_50, rsi_14, macd, macd_signal
+
+    # Running state per stream: weighted value, old weight and observation count
+    w20 = w50 = w12 = w26 = w9 = wup = wdn = np.nan
+    o20 = o50 = o12 = o26 = o9 = oup = odn = 1.0
+    n20 = n50 = n12 = n26 = n9 = nup = ndn = 0
+
+    for i in range(n):
+        c = np.float64(close[i])
+
+        # --- Trend Indicators ---
+        w20, o20, n20, ema_20[i] = _ewm_step(w20, o20, n20, c, a20, 20)
+        w50, o50, n50, ema_50[i] = _ewm_step(w50, o50, n50, c, a50, 50)
+
+        # --- Momentum Indicator ---
+        # Differences are taken in the input precision, like `close.diff()`
+        d = np.float64(close[i] - close[i - 1]) if i > 0 else np.nan
+        up = d if d > 0 else 0.0
+        dn = -d if d < 0 else -0.0
+        wup, oup, nup, avg_gain = _ewm_step(wup, oup, nup, up, a14, 14)
+        wdn, odn, ndn, avg_loss = _ewm_step(wdn, odn, ndn, dn, a14, 14)
+        if avg_loss == 0:
+            rsi_14[i] = 100.0
+        else:
+            rsi_14[i] = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+        # --- MACD (Trend/Momentum Crossover) ---
+        w12, o12, n12, e12 = _ewm_step(w12, o12, n12, c, a12, 12)
+        w26, o26, n26, e26 = _ewm_step(w26, o26, n26, c, a26, 26)
+        m = e12 - e26
+        macd[i] = m
+        w9, o9, n9, macd_signal[i] = _ewm_step(w9, o9, n9, m, a9, 9)
+
+    return ema_20, ema_50, rsi_14, macd, macd_signal
+
+@njit(cache=True, parallel=True)
+def _fused_indicators_2d(closes, a20, a50, a12, a26, a9, a14):
+    """
+    Run `_fused_indicators` over every column of a (n_bars, n_symbols) price matrix.
+
+    Columns are independent series and are processed in parallel threads.
+
+    Returns:
+        tuple: (ema_20, ema_50, rsi_14, macd, macd_signal) float64 matrices of shape
+               (n_bars, n_symbols).
+    """
+    n, m = closes.shape
+    # Stored symbol-major so each thread writes contiguous rows
+    ema_20 = np.empty((m, n), dtype=np.float64)
+    ema_50 = np.empty((m, n), dtype=np.float64)
+    rsi_14 = np.empty((m, n), dtype=np.float64)
+    macd = np.empty((m, n), dtype=np.float64)
+    macd_signal = np.empty((m, n), dtype=np.float64)
+
+    for j in prange(m):
+        e20, e50, rsi, m_line, m_signal = _fused_indicators(closes[:, j], a20, a50, a12, a26, a9, a14)
+        ema_20[j] = e20
+        ema_50[j] = e50
+        rsi_14[j] = rsi
+        macd[j] = m_line
+        macd_signal[j] = m_signal
+
+    return ema_20.T, ema_50.T, rsi_14.T, macd.T, macd_signal.T
+
+# Smoothing factors, derived the same way pandas does from span/alpha
+_ALPHAS = tuple(
+    1.0 / (1.0 + com)
+    for com in (
+        _ewm_com(span=20),
+        _ewm_com(span=50),
+        _ewm_com(span=12),
+        _ewm_com(span=26),
+        _ewm_com(span=9),
+        _ewm_com(alpha=1 / 14),
+    )
+)
+
+# Output column names, in the order `_fused_indicators` returns them
+INDICATOR_COLUMNS = ("ema_20", "ema_50", "rsi_14", "macd", "macd_signal")
+
+# AOT kernels are exported per input dtype and do no type checking of their own
+_FUSED_AOT = (
+    {np.dtype(np.float32): _aot.fused_indicators_f4, np.dtype(np.float64): _aot.fused_indicators_f8}
+    if _aot is not None
+    else {}
+)
 
 def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -39,21 +186,32 @@ def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
         Some rows may contain NaNs due to indicator window lookbacks. Consider
         using `df.dropna()` downstream to clean data before use.
     """
-    df = df.copy()  # Avoid mutating original input
+    close = np.ascontiguousarray(df['close'].to_numpy())
+    if close.dtype not in (np.float32, np.float64):
+        close = close.astype(np.float64)
 
-    # --- Trend Indicators ---
-    df['ema_20'] = EMAIndicator(close=df['close'], window=20).ema_indicator()
-    df['ema_50'] = EMAIndicator(close=df['close'], window=50).ema_indicator()
+    fused = _FUSED_AOT.get(close.dtype, _fused_indicators)
+    df = df.copy()  # Avoid mutating original input
+    for name, values in zip(INDICATOR_COLUMNS, fused(close, *_ALPHAS)):
+        df[name] = values
 
-    # --- Momentum Indicator ---
-    df['rsi_14'] = RSIIndicator(close=df['close'], window=14).rsi()
+    return df
 
-    # --- MACD (Trend/Momentum Crossover) ---
-    macd = MACD(close=df['close'])
-    df['macd'] = macd.macd()
-    df['macd_signal'] = macd.macd_signal()
+def indicators_2d(closes: np.ndarray) -> dict:
+    """
+    Compute the indicator set for several symbols at once.
 
-    # Optional: Drop NaNs caused by indicator lookback periods
-    # df.dropna(inplace=True)
+    Args:
+        closes (np.ndarray): (n_bars, n_symbols) close price matrix, one column per
+            symbol (float32 or float64).
 
-    return df
+    Returns:
+        dict[str, np.ndarray]: Indicator name -> (n_bars, n_symbols) float64 matrix,
+            with the same keys and values `add_indicators` produces per column.
+    """
+    closes = np.asarray(closes)
+    if closes.dtype not in (np.float32, np.float64):
+        closes = closes.astype(np.float64)
+    # Column-major layout keeps each symbol's series contiguous for the kernel
+    closes = np.asfortranarray(closes)
+    return dict(zip(INDICATOR_COLUMNS, _fused_indicators_2d(closes, *_ALPHAS)))
@@ -13,13 +13,18 @@ import math
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from numba import njit
+from backend.services._aot import load_kernels
+
+# Pre-built kernels from `python -m backend.services._aot_build`, if built from this source
+_aot = load_kernels(__name__)
 
 def generate_equity_curve(trades: list, start_value: float = 10000) -> pd.DataFrame:
     """
     Generates a time series of portfolio value based on the sequence of closed trades.
 
     Args:
-        trades (list): List of trade dicts, each with 'exit_time' and 'pnl' keys.
+        trades (list): List of trade dicts, each with 'exit_time' and 'pnl_pct' keys.
         start_value (float): Starting capital for the portfolio.
 
     Returns:
@@ -30,30 +35,113 @@ def generate_equity_curve(trades: list, start_value: float = 10000) -> pd.DataFr
     if not trades:
         return pd.DataFrame(columns=["timestamp", "portfolio_value"])
 
-    df = pd.DataFrame(trades).sort_values("exit_time").reset_index(drop=True)
+    n = len(trades)
+    exit_times = np.array([t["exit_time"] for t in trades], dtype="datetime64[ns]")
+    pnl = np.fromiter((t["pnl_pct"] for t in trades), dtype=np.float64, count=n)
+
+    # Order by exit time, then add up percentage returns the way calculate_metrics
+    # does for totalReturnPct (uncompounded, relative to the starting capital)
+    order = np.argsort(exit_times, kind="stable")
+
+    return pd.DataFrame({
+        "timestamp": exit_times[order],
+        "portfolio_value": start_value * (1 + np.cumsum(pnl[order]) / 100),
+    })
+
+@njit(cache=True)
+def _price_stats(close):
+    """
+    Compute bar returns, their moments and the maximum drawdown in a single pass.
 
-    equity = start_value
-    equity_curve = []
+    Returns follow `close.pct_change().dropna()`: missing prices are forward-filled
+    (giving a 0.0 return) and leading NaNs are dropped. Mean and standard deviations
+    (ddof=1) are accumulated with Welford's method. The drawdown tracks the running
+    peak of cumulative returns (close / first close), skipping NaN prices.
 
-    for trade in df.itertuples():
-        equity += trade.pnl  # Add profit/loss to capital
-        equity_curve.append((trade.exit_time, equity))
+    Args:
+        close (np.ndarray): Close prices (float32 or float64).
 
-    return pd.DataFrame(equity_curve, columns=["timestamp", "portfolio_value"]).assign(
-        timestamp=lambda x: pd.to_datetime(x["timestamp"])
-    )
+    Returns:
+        tuple: (returns, mean, std, downside_std, max_drawdown) where `returns` is a
+               float64 array, `downside_std` covers negative returns only and
+               `max_drawdown` is the most negative drawdown as a fraction. Statistics
+               without enough observations are NaN.
+    """
+    n = close.shape[0]
+    returns = np.empty(max(n - 1, 0), dtype=np.float64)
+    k = 0
+    cnt = 0
+    mean = 0.0
+    m2 = 0.0
+    dn_cnt = 0
+    dn_mean = 0.0
+    dn_m2 = 0.0
+
+    first = np.float64(close[0]) if n > 0 else np.nan
+    peak = 1.0
+    max_dd = 0.0 if first == first else np.nan
+    prev = first
+
+    for i in range(1, n):
+        c = np.float64(close[i])
+
+        # --- Drawdown ---
+        if first == first and c == c:
+            cum = c / first
+            if cum > peak:
+                peak = cum
+            dd = cum / peak - 1.0
+            if dd < max_dd:
+                max_dd = dd
+
+        # --- Returns (forward-filled like pct_change) ---
+        if c != c:
+            c = prev
+        if prev == prev and c == c:
+            r = c / prev - 1.0
+            returns[k] = r
+            k += 1
+
+            cnt += 1
+            d = r - mean
+            mean += d / cnt
+            m2 += d * (r - mean)
+
+            if r < 0:
+                dn_cnt += 1
+                d = r - dn_mean
+                dn_mean += d / dn_cnt
+                dn_m2 += d * (r - dn_mean)
+        prev = c
+
+    mean_out = mean if cnt > 0 else np.nan
+    std = np.sqrt(m2 / (cnt - 1)) if cnt > 1 else np.nan
+    downside_std = np.sqrt(dn_m2 / (dn_cnt - 1)) if dn_cnt > 1 else np.nan
+    return returns[:k], mean_out, std, downside_std, max_dd
+
+# AOT kernels are exported per input dtype and do no type checking of their own
+_PRICE_STATS_AOT = (
+    {np.dtype(np.float32): _aot.price_stats_f4, np.dtype(np.float64): _aot.price_stats_f8}
+    if _aot is not None
+    else {}
+)
 
 def safe_float(v):
     """
     Safely round a value to 2 decimal places, or return 0.0 if invalid.
 
+    NumPy scalars (e.g. float32 stats from float32 price columns) are upcast
+    to a plain Python float.
+
     Args:
-        v (float | int | None): Input value.
+        v (float | int | np.number | None): Input value.
 
     Returns:
         float: Cleaned and rounded value.
     """
-    return round(v, 2) if isinstance(v, (int, float)) and math.isfinite(v) else 0.0
+    if isinstance(v, (int, float, np.integer, np.floating)) and math.isfinite(v):
+        return round(float(v), 2)
+    return 0.0
 
 def calculate_metrics(df: pd.DataFrame, trades: list) -> dict:
     """
@@ -80,50 +168,58 @@ def calculate_metrics(df: pd.DataFrame, trades: list) -> dict:
     if not trades:
         return {}
 
-    trades_df = pd.DataFrame(trades)
-    trades_df["entry_time"] = pd.to_datetime(trades_df["entry_time"])
-    trades_df["exit_time"] = pd.to_datetime(trades_df["exit_time"])
-    trades_df["duration_hrs"] = (trades_df["exit_time"] - trades_df["entry_time"]).dt.total_seconds() / 3600
+    # Trade fields as flat NumPy arrays (no DataFrame construction for a handful of rows)
+    n = len(trades)
+    pnl = np.fromiter((t["pnl_pct"] for t in trades), dtype=np.float64, count=n)
+    entry_price = np.fromiter((t["entry_price"] for t in trades), dtype=np.float64, count=n)
+    entry_time = np.array([t["entry_time"] for t in trades], dtype="datetime64[ns]")
+    exit_time = np.array([t["exit_time"] for t in trades], dtype="datetime64[ns]")
+    duration_hrs = (exit_time - entry_time) / np.timedelta64(1, "h")
 
     # --- Basic Return Metrics ---
-    total_return_pct = trades_df["pnl_pct"].sum()
+    total_return_pct = pnl.sum()
     total_return_usd = 1000 * (total_return_pct / 100)
 
-    start = trades_df["entry_time"].min()
-    end = trades_df["exit_time"].max()
-    duration_years = max((end - start).days / 365.0, 1e-6)
+    start = entry_time.min()
+    end = exit_time.max()
+    duration_years = max(int((end - start) // np.timedelta64(1, "D")) / 365.0, 1e-6)
 
+    # A wiped-out account (final value <= 0) has no real-valued CAGR
     final_value = 1000 * (1 + total_return_pct / 100)
-    cagr = ((final_value / 1000) ** (1 / duration_years) - 1) * 100
+    cagr = ((final_value / 1000) ** (1 / duration_years) - 1) * 100 if final_value > 0 else np.nan
+
+    # --- Bar returns, their moments and max drawdown (single pass) ---
+    close = np.ascontiguousarray(np.asarray(df["close"]))
+    if close.dtype not in (np.float32, np.float64):
+        close = close.astype(np.float64)
+    daily_returns, avg_daily_return, returns_std, downside_std, max_dd = _PRICE_STATS_AOT.get(
+        close.dtype, _price_stats
+    )(close)
 
     # --- Volatility (Annualized Std Dev) ---
-    daily_returns = df["close"].pct_change().dropna()
-    volatility_pct = daily_returns.std() * np.sqrt(365) * 100
+    volatility_pct = returns_std * np.sqrt(365) * 100
 
     # --- Max Drawdown ---
-    df["cum_returns"] = df["close"] / df["close"].iloc[0]
-    df["rolling_max"] = df["cum_returns"].cummax()
-    df["drawdown"] = df["cum_returns"] / df["rolling_max"] - 1
-    max_drawdown_pct = df["drawdown"].min() * 100
-    max_drawdown_usd = 1000 * abs(df["drawdown"].min())
+    max_drawdown_pct = max_dd * 100
+    max_drawdown_usd = 1000 * abs(max_dd)
 
     # --- Risk Ratios ---
-    avg_daily_return = daily_returns.mean()
-    downside_std = daily_returns[daily_returns < 0].std()
-    sharpe = (avg_daily_return / daily_returns.std()) * np.sqrt(365)
-    sortino = (avg_daily_return / downside_std) * np.sqrt(365)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.float64(avg_daily_return) / returns_std * np.sqrt(365)
+        sortino = np.float64(avg_daily_return) / downside_std * np.sqrt(365)
     calmar = total_return_pct / abs(max_drawdown_pct) if max_drawdown_pct != 0 else 0
 
     # --- Trade Statistics ---
-    total_trades = len(trades_df)
-    win_rate = (trades_df["pnl_pct"] > 0).mean() * 100
-    avg_trade_duration = trades_df["duration_hrs"].mean()
-    largest_win = trades_df["pnl_pct"].max()
-    largest_loss = trades_df["pnl_pct"].min()
-    turnover = trades_df["entry_price"].sum() / 1000 * 100  # normalized to initial capital
+    total_trades = n
+    win_rate = (pnl > 0).mean() * 100
+    avg_trade_duration = duration_hrs.mean()
+    largest_win = pnl.max()
+    largest_loss = pnl.min()
+    turnover = entry_price.sum() / 1000 * 100  # normalized to initial capital
 
     # --- Value at Risk (VaR) @ 95% ---
-    var_95 = np.percentile(daily_returns, 5) * 100 * 1000
+    # np.percentile selects via partitioning (O(n)), not a full sort
+    var_95 = np.percentile(daily_returns, 5) * 100 * 1000 if len(daily_returns) else np.nan
 
     return {
         "totalReturnPct": safe_float(total_return_pct),
@@ -0,0 +1,250 @@
+"""
+Module: rule_compiler.py
+
+Compiles strategy rule trees (see schema.py) into functions that evaluate the
+whole tree over a DataFrame (or a dict of column arrays) with vectorized NumPy ops.
+
+Core functions:
+- parse_rule(): Convert a rule dict into Condition/Logic models
+- compile_node(): Compile a Condition/Logic tree into a boolean row-mask function
+- row_count(): Number of rows of a DataFrame or dict of column arrays
+
+`OPERATORS` is the one table of rule operators, shared with the row-wise,
+numexpr and fused Numba evaluators in rule_engine.py.
+"""
+
+import operator
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, NamedTuple, Union
+import numpy as np
+import pandas as pd
+from backend.models.schema import Condition, Logic
+
+class Operator(NamedTuple):
+    """
+    Implementations of one comparison operator.
+
+    Attributes:
+        ufunc (np.ufunc): Vectorized comparison over whole columns.
+        compare (Callable): Comparison of two scalars (only the requested one is evaluated).
+        token (str): Python/numexpr infix token.
+    """
+    ufunc: np.ufunc
+    compare: Callable
+    token: str
+
+OPERATORS = {
+    ">": Operator(np.greater, operator.gt, ">"),
+    "<": Operator(np.less, operator.lt, "<"),
+    "=": Operator(np.equal, operator.eq, "=="),
+    ">=": Operator(np.greater_equal, operator.ge, ">="),
+    "<=": Operator(np.less_equal, operator.le, "<="),
+    "!=": Operator(np.not_equal, operator.ne, "!="),
+}
+
+# Integer representation of NaT when datetime64[ns] values are viewed as int64
+NAT = np.iinfo(np.int64).min
+
+# Compiled rule functions, keyed by model type and repr(model_dump()): an LRU
+# bounded by COMPILED_CACHE_SIZE, least recently used first
+COMPILED_CACHE_SIZE = 256
+_compiled_cache = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+def _compiled_get(key):
+    """
+    Return the cached compiled function for `key`, or None.
+    """
+    with _compiled_cache_lock:
+        fn = _compiled_cache.get(key)
+        if fn is not None:
+            _compiled_cache.move_to_end(key)
+        return fn
+
+def _compiled_put(key, fn) -> None:
+    """
+    Cache a compiled function, evicting the least recently used beyond COMPILED_CACHE_SIZE.
+    """
+    with _compiled_cache_lock:
+        _compiled_cache[key] = fn
+        _compiled_cache.move_to_end(key)
+        while len(_compiled_cache) > COMPILED_CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+
+def parse_rule(rule) -> Union[Condition, Logic]:
+    """
+    Convert a rule dict (as sent by the frontend) into Condition/Logic models.
+
+    Uses `model_construct` so loosely formed rules keep evaluating to False
+    (e.g. an unknown operator) instead of failing validation.
+
+    Args:
+        rule (dict | Condition | Logic): Rule tree with "and"/"or"/"not" keys or a condition.
+
+    Returns:
+        Union[Condition, Logic]: Model tree ready for `compile_node()`.
+    """
+    if isinstance(rule, (Condition, Logic)):
+        return rule
+    if not isinstance(rule, dict):
+        return Logic.model_construct()
+    if rule.get("and") is not None:
+        return Logic.model_construct(and_=[parse_rule(sub) for sub in rule["and"]])
+    if rule.get("or") is not None:
+        return Logic.model_construct(or_=[parse_rule(sub) for sub in rule["or"]])
+    if rule.get("not") is not None:
+        return Logic.model_construct(not_=parse_rule(rule["not"]))
+    return Condition.model_construct(left=rule.get("left"), op=rule.get("op"), right=rule.get("right"))
+
+def datetime_literal(value):
+    """
+    Parse a constant operand as datetime64, or return None if it is not a date.
+    """
+    try:
+        return pd.Timestamp(value).to_datetime64()
+    except (TypeError, ValueError):
+        return None
+
+def row_count(data) -> int:
+    """
+    Number of rows in a DataFrame or in a dict of equal-length column arrays.
+    """
+    if isinstance(data, Mapping):
+        return len(next(iter(data.values()), ()))
+    return len(data)
+
+def _missing(values):
+    """
+    Missing-value (NaN/NaT) mask of an operand, chosen by dtype kind.
+
+    Returns a fresh boolean array for arrays that can hold missing values, None
+    for integer/bool arrays (never missing), and True/False for scalars.
+    """
+    if not isinstance(values, np.ndarray):
+        return bool(pd.isna(values))
+    kind = values.dtype.kind
+    if kind == "f":
+        return np.isnan(values)
+    if kind in "mM":
+        return np.isnat(values)
+    if kind in "biu":
+        return None
+    return np.asarray(pd.isna(values), dtype=bool)  # object and other dtypes
+
+def _operand(df, value, as_datetime: bool, parsed=None):
+    """
+    Resolve a condition operand to a column array, or a scalar constant.
+
+    Strings naming a DataFrame column resolve to that column; anything else is a
+    constant broadcast against the other side. Timestamp comparisons convert both
+    sides to datetime64: columns only if not already datetime64, and constants
+    via `parsed` (pre-parsed at compile time) when available.
+    """
+    if isinstance(value, str) and value in df:
+        values = np.asarray(df[value])
+        if as_datetime and values.dtype.kind != "M":
+            values = np.asarray(pd.to_datetime(df[value]))
+        return values
+    if as_datetime:
+        return parsed if parsed is not None else pd.Timestamp(value).to_datetime64()
+    return value
+
+def _compile_condition(cond: Condition) -> Callable[[pd.DataFrame], np.ndarray]:
+    """
+    Compile a condition into a function returning a boolean mask per DataFrame row.
+
+    Rows where either operand is missing (NaN/NaT) evaluate to False, as does
+    every row if the operator is unknown or the left column is absent. Other
+    invalid comparisons raise; check rules up front with `rule_engine.validate_rule`.
+    """
+    left, right = cond.left, cond.right
+    op = OPERATORS.get(cond.op)
+    named_timestamp = isinstance(left, str) and "timestamp" in left.lower()
+    # Parse a constant timestamp literal once here, not on every evaluation
+    right_dt = datetime_literal(right)
+
+    def evaluate(df) -> np.ndarray:
+        n = row_count(df)
+        if op is None or (isinstance(left, str) and left not in df):
+            return np.zeros(n, dtype=bool)
+        # Datetime comparison for 'timestamp'-named or datetime64 left columns
+        as_datetime = named_timestamp or (
+            isinstance(left, str) and df[left].dtype.kind == "M"
+        )
+        left_val = _operand(df, left, as_datetime)
+        right_val = _operand(df, right, as_datetime, right_dt)
+        result = np.empty(n, dtype=bool)
+        op.ufunc(left_val, right_val, out=result)
+        for operand in (left_val, right_val):
+            missing = _missing(operand)
+            if isinstance(missing, np.ndarray):
+                result &= np.logical_not(missing, out=missing)
+            elif missing:
+                result[:] = False
+        return result
+
+    return evaluate
+
+def _compile_logic(logic: Logic) -> Callable[[pd.DataFrame], np.ndarray]:
+    """
+    Compile a logic tree into a function returning a boolean mask per DataFrame row.
+
+    Children are compiled once and their masks combined in order with `&=` / `|=`,
+    stopping early once an AND mask is all False or an OR mask all True; NOT
+    uses `np.logical_not`. AND takes precedence over OR, and OR over NOT; a
+    Logic with no branch set is False everywhere.
+    """
+    if logic.and_ is not None:
+        children = [compile_node(sub) for sub in logic.and_]
+
+        def evaluate(df) -> np.ndarray:
+            mask = np.ones(row_count(df), dtype=bool)
+            for child in children:
+                mask &= child(df)
+                if not mask.any():
+                    break  # False everywhere: remaining children can't change it
+            return mask
+    elif logic.or_ is not None:
+        children = [compile_node(sub) for sub in logic.or_]
+
+        def evaluate(df) -> np.ndarray:
+            mask = np.zeros(row_count(df), dtype=bool)
+            for child in children:
+                mask |= child(df)
+                if mask.all():
+                    break  # True everywhere: remaining children can't change it
+            return mask
+    elif logic.not_ is not None:
+        child = compile_node(logic.not_)
+
+        def evaluate(df) -> np.ndarray:
+            return np.logical_not(child(df))
+    else:
+        def evaluate(df) -> np.ndarray:
+            return np.zeros(row_count(df), dtype=bool)
+
+    return evaluate
+
+def compile_node(node: Union[Condition, Logic]) -> Callable[[pd.DataFrame], np.ndarray]:
+    """
+    Compile a Condition/Logic tree into a function returning a boolean row mask.
+
+    Compiled functions are cached (see COMPILED_CACHE_SIZE), so equal subtrees
+    are compiled once.
+
+    Args:
+        node (Condition | Logic): Parsed rule tree (see `parse_rule`).
+
+    Returns:
+        Callable[[pd.DataFrame | Mapping[str, np.ndarray]], np.ndarray]: Mask function.
+    """
+    key = (type(node).__name__, repr(node.model_dump(warnings=False)))
+    cached = _compiled_get(key)
+    if cached is not None:
+        return cached
+
+    fn = _compile_logic(node) if isinstance(node, Logic) else _compile_condition(node)
+    _compiled_put(key, fn)
+    return fn
@@ -13,18 +13,50 @@ Supports:
 Core functions:
 - eval_condition(): Single rule evaluation
 - eval_logic(): Recursive logic evaluation
-- generate_signals(): Apply logic rules to DataFrame rows
+- eval_condition_vec() / eval_logic_vec(): Whole-column versions returning boolean masks
+- rule_to_expr() / eval_logic_numexpr(): Rule tree as a numexpr expression (opt-in)
+- compile_rule_to_numba(): Fuse a rule tree into a single-pass Numba kernel
+- collect_cols(): Column names referenced by a rule tree
+- validate_rule(): Check operators, columns and operand types of a rule tree up front
+- compile_rule(): Compile a rule once into a reusable `CompiledRule`
+- cached_mask(): Memoized `CompiledRule.evaluate` per (source frame, rule)
+- generate_signals(): Apply logic rules to a DataFrame (vectorized via `rule_compiler.compile_node()`)
 """
 
-import pandas as pd
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Union
+import numpy as np
+import pandas as pd
+from numba import njit
+from backend.models.schema import Condition, Logic
+from backend.services.rule_compiler import (
+    NAT,
+    OPERATORS,
+    compile_node,
+    datetime_literal,
+    parse_rule,
+    row_count,
+)
+from backend.services.data_loader import CACHE_DIR
+
+logger = logging.getLogger(__name__)
 
-def eval_condition(row: pd.Series, cond: dict) -> bool:
+def eval_condition(row: Union[pd.Series, dict], cond: dict) -> bool:
     """
     Evaluate a single binary condition on a DataFrame row.
 
     Args:
-        row (pd.Series): Row of data (one timestamp's indicators/prices).
+        row (pd.Series | dict): Row of data (one timestamp's indicators/prices).
         cond (dict): A condition dict with keys:
             - left (str | float | int): LHS variable or constant
             - right (str | float | int): RHS variable or constant
@@ -49,20 +81,14 @@ def eval_condition(row: pd.Series, cond: dict) -> bool:
         if pd.isna(left_val) or pd.isna(right):
             return False
 
-        return {
-            ">": left_val > right,
-            "<": left_val < right,
-            "=": left_val == right,
-            ">=": left_val >= right,
-            "<=": left_val <= right,
-            "!=": left_val != right,
-        }.get(op, False)
-
-    except Exception as e:
-        print(f"[eval_condition ERROR] {e} | Condition: {cond}")
+        op = OPERATORS.get(op)
+        return False if op is None else op.compare(left_val, right)
+
+    except Exception:
+        logger.exception("eval_condition failed | Condition: %s", cond)
         return False
 
-def eval_logic(row: pd.Series, rule: Union[dict, list]) -> bool:
+def eval_logic(row: Union[pd.Series, dict], rule: Union[dict, list]) -> bool:
     """
     Recursively evaluate a logical expression or tree on a row.
 
@@ -73,7 +99,7 @@ def eval_logic(row: pd.Series, rule: Union[dict, list]) -> bool:
         - Base case: simple condition dict
 
     Args:
-        row (pd.Series): Single row from a DataFrame.
+        row (pd.Series | dict): Single row from a DataFrame.
         rule (dict | list): A nested rule structure (see schema.py).
 
     Returns:
@@ -90,46 +116,638 @@ def eval_logic(row: pd.Series, rule: Union[dict, list]) -> bool:
             else:
                 return eval_condition(row, rule)
         return False
-    except Exception as e:
-        print(f"[eval_logic ERROR] {e} | Rule: {rule}")
+    except Exception:
+        logger.exception("eval_logic failed | Rule: %s", rule)
         return False
 
+def eval_condition_vec(df, cond: dict) -> np.ndarray:
+    """
+    Evaluate a single binary condition on every row of a DataFrame at once.
+
+    Column operands resolve to whole columns and constants broadcast; the
+    operator dispatches to the matching NumPy comparison ufunc.
+
+    Args:
+        df (pd.DataFrame | Mapping[str, np.ndarray]): OHLCV + indicator DataFrame,
+            or a dict of its column arrays.
+        cond (dict): A condition dict with 'left', 'op' and 'right' keys (see `eval_condition`).
+
+    Returns:
+        np.ndarray[bool]: Row mask; rows where either operand is NaN/NaT are False.
+    """
+    return compile_node(parse_rule(cond))(df)
+
+def eval_logic_vec(df, rule: Union[dict, list]) -> np.ndarray:
+    """
+    Recursively evaluate a logical expression or tree on every row of a DataFrame.
+
+    Column-wise equivalent of `eval_logic`: AND/OR combine child masks in order,
+    skipping the remaining children once the result is already determined;
+    NOT inverts its child.
+
+    Args:
+        df (pd.DataFrame | Mapping[str, np.ndarray]): OHLCV + indicator DataFrame,
+            or a dict of its column arrays.
+        rule (dict | list): A nested rule structure (see schema.py).
+
+    Returns:
+        np.ndarray[bool]: Row mask, one value per DataFrame row.
+    """
+    return compile_node(parse_rule(rule))(df)
+
+# --- numexpr expressions ---
+
+def _expr_operand(value, columns, other_dtype=None) -> str:
+    """
+    Render one condition operand for `DataFrame.eval`: a quoted column or a literal.
+
+    numexpr compares a float32 column with a float64 literal in float64, while
+    NumPy first casts the literal to float32. A literal compared with a float
+    column is therefore rounded to that column's dtype, then written out exactly.
+    """
+    if isinstance(value, str):
+        if value in columns and "`" not in value:
+            return f"`{value}`"
+        raise ValueError(f"Unsupported operand for numexpr: {value!r}")
+    if isinstance(value, (bool, int, float)) and np.isfinite(value):
+        if other_dtype is not None and other_dtype.kind == "f" and not isinstance(value, bool):
+            return repr(float(other_dtype.type(value)))
+        return repr(value)
+    raise ValueError(f"Unsupported operand for numexpr: {value!r}")
+
+def _expr_dtype(value, dtypes):
+    """
+    NumPy dtype of a column operand, or None for constants and unknown dtypes.
+    """
+    if isinstance(value, str) and dtypes is not None and value in dtypes:
+        dtype = dtypes[value]
+        return dtype if isinstance(dtype, np.dtype) else None
+    return None
+
+def rule_to_expr(rule, columns, dtypes=None) -> str:
+    """
+    Convert a rule tree into an infix expression for `DataFrame.eval(engine="numexpr")`.
+
+    AND/OR/NOT become `&`, `|` and `~` (fully parenthesized), '=' becomes '==' and
+    column names are backtick-quoted. '!=' is guarded so NaN rows stay False, as in
+    `eval_logic_vec`.
+
+    Args:
+        rule (dict | Condition | Logic): Rule tree (see schema.py).
+        columns (Collection[str]): Column names of the frame it will run on.
+        dtypes (Mapping[str, np.dtype], optional): Column dtypes (e.g. `df.dtypes`),
+            used to round constants compared with float32 columns NumPy's way.
+
+    Returns:
+        str: Expression string.
+
+    Raises:
+        ValueError: For rules numexpr can't evaluate with the same semantics
+            (timestamp comparisons, missing columns, empty AND/OR, non-finite
+            or non-numeric constants, unknown operators).
+    """
+    node = parse_rule(rule)
+    if isinstance(node, Logic):
+        if node.and_ or node.or_:
+            joiner = " & " if node.and_ else " | "
+            return "(" + joiner.join(rule_to_expr(sub, columns, dtypes) for sub in node.and_ or node.or_) + ")"
+        if node.not_ is not None:
+            return f"~{rule_to_expr(node.not_, columns, dtypes)}"
+        raise ValueError("Empty logic node")
+
+    left, op, right = node.left, OPERATORS.get(node.op), node.right
+    if op is None or not isinstance(left, str) or left not in columns or "timestamp" in left.lower():
+        raise ValueError(f"Unsupported condition for numexpr: {node!r}")
+    lhs = _expr_operand(left, columns, _expr_dtype(right, dtypes))
+    rhs = _expr_operand(right, columns, _expr_dtype(left, dtypes))
+    expr = f"({lhs} {op.token} {rhs})"
+    if op.token == "!=":
+        # NaN != x is True; missing operands must make the condition False
+        guards = [f"({side} == {side})" for side in (lhs, rhs) if side.startswith("`")]
+        expr = "(" + " & ".join([expr] + guards) + ")"
+    return expr
+
+def eval_logic_numexpr(df: pd.DataFrame, rule) -> np.ndarray:
+    """
+    Evaluate a rule tree with numexpr via `DataFrame.eval`, in one fused pass.
+
+    Falls back to `eval_logic_vec` if the rule can't be expressed (see
+    `rule_to_expr`), numexpr isn't installed, or evaluation fails. Not used by
+    `generate_signals`: the fused Numba kernel is faster on large frames, and
+    `DataFrame.eval`'s parsing cost exceeds the NumPy path on small ones.
+
+    Args:
+        df (pd.DataFrame): OHLCV + indicator DataFrame.
+        rule (dict | Condition | Logic): Rule tree (see schema.py).
+
+    Returns:
+        np.ndarray[bool]: Row mask, one value per DataFrame row.
+    """
+    try:
+        result = np.asarray(df.eval(rule_to_expr(rule, df.columns, df.dtypes), engine="numexpr"))
+        if result.dtype == np.bool_ and result.shape == (len(df),):
+            return result
+    except Exception:
+        pass  # Unsupported rule or numexpr unavailable: use the NumPy path
+    return eval_logic_vec(df, rule)
+
+# --- Fused Numba rule kernels ---
+
+# Frames longer than this evaluate each rule in one fused Numba pass
+NUMBA_RULE_MIN_ROWS = 5000
+
+# Generated kernel modules, cached on disk next to the parquet cache
+RULE_KERNEL_DIR = os.path.join(CACHE_DIR, "rules")
+
+# Compiled kernels keyed by generated source (constants are arguments, so rules
+# that differ only in thresholds share one kernel)
+_numba_rule_kernels = {}
+
+def _emit_operand(value, as_datetime: bool, other_dtype, dtypes, columns: list, consts: list):
+    """
+    Emit the element expression and missing-value guard for one operand.
+
+    Columns become kernel array arguments (`c0`, `c1`, ...) and constants scalar
+    arguments (`k0`, `k1`, ...). Returns None for operands the kernel cannot
+    evaluate with NumPy's semantics.
+    """
+    if isinstance(value, str) and value in dtypes:
+        dtype = dtypes[value]
+        # Plain NumPy dtypes only: datetime64 for timestamp comparisons, numeric otherwise
+        if not isinstance(dtype, np.dtype) or dtype.kind not in ("M" if as_datetime else "biuf"):
+            return None
+        if value not in columns:
+            columns.append(value)
+        expr = f"c{columns.index(value)}[i]"
+    else:
+        if as_datetime:
+            try:
+                value = np.datetime64(pd.Timestamp(value).to_datetime64(), "ns").astype(np.int64)
+            except (TypeError, ValueError):
+                return None
+        elif isinstance(value, (bool, int, float)):
+            # Match NumPy's value-based casting: a Python scalar compared with a
+            # float column is converted to that column's dtype first
+            if other_dtype is not None and other_dtype.kind == "f":
+                value = other_dtype.type(value)
+            elif isinstance(value, int) and not -2**63 <= value < 2**63:
+                return None
+        else:
+            return None
+        consts.append(value)
+        expr = f"k{len(consts) - 1}"
+
+    if as_datetime:
+        return expr, f"{expr} != NAT"
+    return expr, f"{expr} == {expr}"
+
+def _emit_rule(node, dtypes, columns: list, consts: list):
+    """
+    Emit a single boolean expression (evaluated at row `i`) for a parsed rule tree.
+
+    Follows `compile_node` semantics, with AND/OR
+    short-circuiting per row. Returns None if any node is unsupported.
+    """
+    if isinstance(node, Logic):
+        if node.and_ is not None or node.or_ is not None:
+            children = node.and_ if node.and_ is not None else node.or_
+            joiner = " and " if node.and_ is not None else " or "
+            parts = [_emit_rule(sub, dtypes, columns, consts) for sub in children]
+            if any(part is None for part in parts):
+                return None
+            if not parts:
+                return "True" if node.and_ is not None else "False"
+            return "(" + joiner.join(parts) + ")"
+        if node.not_ is not None:
+            part = _emit_rule(node.not_, dtypes, columns, consts)
+            return None if part is None else f"(not {part})"
+        return "False"
+
+    op = OPERATORS.get(node.op)
+    left, right = node.left, node.right
+    if op is None:
+        return "False"
+    if isinstance(left, str) and left not in dtypes:
+        return "False"
+    as_datetime = isinstance(left, str) and (
+        "timestamp" in left.lower() or getattr(dtypes[left], "kind", None) == "M"
+    )
+
+    def dtype_of(value):
+        return dtypes[value] if isinstance(value, str) and value in dtypes else None
+
+    if dtype_of(left) is None and dtype_of(right) is None:
+        return None  # Constant-only conditions use the NumPy path
+
+    lhs = _emit_operand(left, as_datetime, dtype_of(right), dtypes, columns, consts)
+    rhs = _emit_operand(right, as_datetime, dtype_of(left), dtypes, columns, consts)
+    if lhs is None or rhs is None:
+        return None
+    (l_expr, l_guard), (r_expr, r_guard) = lhs, rhs
+    return f"({l_guard} and {r_guard} and {l_expr} {op.token} {r_expr})"
+
+def _build_rule_kernel(source: str):
+    """
+    JIT-compile generated kernel source.
+
+    The source is written to a module under RULE_KERNEL_DIR so Numba's on-disk
+    cache (`cache=True`) can reuse the machine code in other worker processes and
+    across restarts. Falls back to an in-memory compile if the file can't be
+    written or imported (a bad file is deleted so the next build rewrites it).
+    """
+    digest = hashlib.sha1(source.encode()).hexdigest()[:16]
+    path = os.path.join(RULE_KERNEL_DIR, f"rule_{digest}.py")
+    name = f"_rule_kernel_{digest}"
+    module_source = (
+        "import numpy as np\n"
+        "from numba import njit\n\n"
+        f"NAT = {NAT}\n\n"
+        "@njit(cache=True, boundscheck=False)\n"
+        + source
+    )
+    try:
+        if not os.path.exists(path):
+            os.makedirs(RULE_KERNEL_DIR, exist_ok=True)
+            # Unique temp file per writer (threads share a pid), then an atomic
+            # rename, so readers never see a partially written module
+            fd, tmp_path = tempfile.mkstemp(dir=RULE_KERNEL_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(module_source)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module  # Numba's cache re-imports the module by name
+        try:
+            spec.loader.exec_module(module)
+            return module._rule_kernel
+        except Exception:
+            sys.modules.pop(name, None)
+            os.remove(path)
+            raise
+    except Exception:
+        logger.debug("Rule kernel module unavailable, compiling in memory", exc_info=True)
+        namespace = {"np": np, "NAT": NAT}
+        exec(source, namespace)
+        return njit(boundscheck=False)(namespace["_rule_kernel"])
+
+def compile_rule_to_numba(rule, dtypes):
+    """
+    Compile a rule tree into a single fused Numba kernel over the needed columns.
+
+    The generated kernel makes one pass over the rows and writes one output mask,
+    instead of allocating an intermediate mask per condition.
+
+    Args:
+        rule (dict | Condition | Logic): Rule tree (see schema.py).
+        dtypes (Mapping[str, np.dtype]): Column name -> dtype of the frames the rule
+            will run on (e.g. `df.dtypes`).
+
+    Returns:
+        Callable[[pd.DataFrame], np.ndarray] | None: Function returning the boolean
+            row mask, or None if the rule uses operands the kernel does not support
+            (use `eval_logic_vec` instead).
+    """
+    columns, consts = [], []
+    expr = _emit_rule(parse_rule(rule), dtypes, columns, consts)
+    if expr is None:
+        return None
+
+    args = ", ".join(["n"] + [f"c{j}" for j in range(len(columns))] + [f"k{j}" for j in range(len(consts))])
+    source = (
+        f"def _rule_kernel({args}):\n"
+        f"    out = np.empty(n, dtype=np.bool_)\n"
+        f"    for i in range(n):\n"
+        f"        out[i] = {expr}\n"
+        f"    return out\n"
+    )
+    kernel = _numba_rule_kernels.get(source)
+    if kernel is None:
+        kernel = _numba_rule_kernels[source] = _build_rule_kernel(source)
+
+    datetime_columns = {name for name in columns if dtypes[name].kind == "M"}
+
+    def evaluate(df) -> np.ndarray:
+        arrays = []
+        for name in columns:
+            values = np.asarray(df[name])
+            if name in datetime_columns:
+                values = values.astype("datetime64[ns]", copy=False).view(np.int64)
+            arrays.append(np.ascontiguousarray(values))
+        return kernel(row_count(df), *arrays, *consts)
+
+    return evaluate
+
+# --- Compiled rules ---
+
+def collect_cols(rule) -> set:
+    """
+    Collect the string operands of a rule tree (the column names it may reference).
+
+    Strings that are not columns (e.g. date literals) are included too; callers
+    intersect the result with the frame's columns.
+
+    Args:
+        rule (dict | Condition | Logic): Rule tree (see schema.py).
+
+    Returns:
+        set[str]: Candidate column names.
+    """
+    node = parse_rule(rule)
+    if isinstance(node, Logic):
+        children = (node.and_ or []) + (node.or_ or []) + ([node.not_] if node.not_ is not None else [])
+        return set().union(*(collect_cols(child) for child in children))
+    return {value for value in (node.left, node.right) if isinstance(value, str)}
+
+def _column_dtypes(data):
+    """
+    Column name -> dtype of a DataFrame or of a dict of column arrays.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.dtypes
+    return {c: np.asarray(a).dtype for c, a in data.items()}
+
+def _operand_kind(value, dtypes) -> str:
+    """
+    Describe a condition operand for validation: a kind of column, or of constant.
+    """
+    if not isinstance(value, str):
+        return "number"
+    if value not in dtypes:
+        return "string"
+    dtype = dtypes[value]
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return "numeric column"
+    if isinstance(dtype, np.dtype) and dtype.kind in "mM":
+        return "datetime column"
+    return "text column"  # object, string and categorical columns
+
+def validate_rule(rule, dtypes) -> None:
+    """
+    Check a rule tree once, before evaluation, instead of failing per condition.
+
+    A condition is invalid if its operator is unknown, an operand is neither a
+    string nor a number, or its left operand is a string that is not a column.
+    In a timestamp comparison ('timestamp'-named or datetime64 left column) a
+    right-hand string must be a column or a date; otherwise strings that are not
+    columns are only valid against text columns, and numbers only against
+    numeric columns (e.g. `{"left": "close", "op": ">", "right": "3"}` is invalid).
+
+    Args:
+        rule (dict | Condition | Logic | CompiledRule): Rule tree (see schema.py).
+        dtypes (Mapping[str, dtype]): Column name -> dtype of the frame the rule
+            will run on (e.g. `df.dtypes`).
+
+    Raises:
+        ValueError: On the first invalid condition found.
+    """
+    node = rule.rule if isinstance(rule, CompiledRule) else parse_rule(rule)
+    if isinstance(node, Logic):
+        children = (node.and_ or []) + (node.or_ or []) + ([node.not_] if node.not_ is not None else [])
+        for child in children:
+            validate_rule(child, dtypes)
+        return
+
+    left, right = node.left, node.right
+    where = f"in condition {left!r} {node.op} {right!r}"
+    if node.op not in OPERATORS:
+        raise ValueError(f"unknown operator {node.op!r} {where}")
+    for value in (left, right):
+        if not isinstance(value, (str, int, float)):
+            raise ValueError(f"operand {value!r} is neither a string nor a number {where}")
+    if isinstance(left, str) and left not in dtypes:
+        raise ValueError(f"unknown column {left!r} {where}")
+
+    left_kind, right_kind = _operand_kind(left, dtypes), _operand_kind(right, dtypes)
+    if isinstance(left, str) and ("timestamp" in left.lower() or left_kind == "datetime column"):
+        if right_kind == "string" and datetime_literal(right) is None:
+            raise ValueError(f"{right!r} is neither a column nor a date {where}")
+        return
+    kinds = {left_kind, right_kind}
+    if not ("text column" in kinds or kinds <= {"number", "numeric column"} or kinds == {"datetime column"}):
+        raise ValueError(f"cannot compare {left_kind} {left!r} with {right_kind} {right!r} {where}")
+
+class CompiledRule:
+    """
+    A rule tree compiled once, for reuse across many frames (e.g. in parameter sweeps).
+
+    Holds the parsed tree, the columns it may reference and its vectorized mask
+    function. Fused Numba kernels are built lazily, once per column dtype layout
+    (under a per-instance lock, as cached instances are shared between threads).
+    Pickles as its rule tree, so it can be sent to worker processes.
+
+    Attributes:
+        rule (Condition | Logic): Parsed rule tree.
+        columns (frozenset[str]): String operands of the tree (see `collect_cols`).
+        signature (str): SHA-1 of the tree's canonical JSON; equal rules share it.
+    """
+
+    def __init__(self, rule):
+        self.rule = parse_rule(rule)
+        self.columns = frozenset(collect_cols(self.rule))
+        dump = self.rule.model_dump(by_alias=True, exclude_none=True)
+        self.signature = hashlib.sha1(json.dumps(dump, sort_keys=True, default=str).encode()).hexdigest()
+        self._vectorized = compile_node(self.rule)
+        # Referenced column dtypes -> fused kernel (None if unsupported)
+        self._fused = {}
+        self._fused_lock = threading.Lock()
+
+    def __reduce__(self):
+        return (CompiledRule, (self.rule,))
+
+    def evaluate(self, data) -> np.ndarray:
+        """
+        Boolean row mask: fused Numba kernel on large frames, vectorized NumPy otherwise.
+
+        Args:
+            data (pd.DataFrame | Mapping[str, np.ndarray]): Frame or dict of column arrays.
+
+        Returns:
+            np.ndarray[bool]: Row mask, one value per row.
+        """
+        if row_count(data) > NUMBA_RULE_MIN_ROWS:
+            dtypes = _column_dtypes(data)
+            layout = tuple((c, dtypes[c] if c in dtypes else None) for c in sorted(self.columns))
+            fused = self._fused.get(layout, False)  # False: not built yet
+            if fused is False:
+                with self._fused_lock:
+                    if layout not in self._fused:
+                        self._fused[layout] = compile_rule_to_numba(self.rule, dtypes)
+                    fused = self._fused[layout]
+            if fused is not None:
+                return fused(data)
+        return self._vectorized(data)
+
+@functools.lru_cache(maxsize=256)
+def _compile_rule_json(key: str) -> CompiledRule:
+    return CompiledRule(json.loads(key))
+
+def compile_rule(rule) -> CompiledRule:
+    """
+    Compile a rule tree, reusing the result for structurally identical rules.
+
+    Rules are cached by a canonical JSON dump (sorted keys), so equal dicts built
+    separately share one `CompiledRule`. Rules that don't round-trip through JSON
+    are compiled without caching.
+
+    Args:
+        rule (dict | Condition | Logic | CompiledRule): Rule tree (see schema.py).
+
+    Returns:
+        CompiledRule: Compiled rule (returned as-is if already compiled).
+    """
+    if isinstance(rule, CompiledRule):
+        return rule
+    if isinstance(rule, (Condition, Logic)):
+        rule = rule.model_dump(by_alias=True, exclude_none=True)
+    try:
+        key = json.dumps(rule, sort_keys=True)
+    except (TypeError, ValueError):
+        return CompiledRule(rule)
+    return _compile_rule_json(key)
+
+# --- Mask memo ---
+
+MASK_CACHE_SIZE = 64
+
+# (id(frame), rule signature, column buffers) -> (weakref to frame, read-only mask),
+# least recently used first. Guarded by `_mask_cache_lock` (routes run on threads).
+_mask_cache = OrderedDict()
+_mask_cache_lock = threading.Lock()
+
+def cached_mask(frame: pd.DataFrame, rule: CompiledRule, data) -> np.ndarray:
+    """
+    `rule.evaluate(data)`, memoized per source frame and rule signature.
+
+    Only for frames that are never modified, such as the shared results of
+    `get_indicatorized`: repeated requests with the same rule skip evaluation.
+    Entries hold only a weak reference to the frame, checked on lookup, so a
+    reused `id()` never hits a dead frame's mask. The key also records each
+    referenced column's buffer address, so replacing a column misses; editing
+    values in place does not, and would return a stale mask.
+
+    Args:
+        frame (pd.DataFrame): Frame the arrays in `data` were taken from.
+        rule (CompiledRule): Compiled rule.
+        data (pd.DataFrame | Mapping[str, np.ndarray]): Columns passed to `rule.evaluate`.
+
+    Returns:
+        np.ndarray[bool]: Read-only row mask, shared between hits; copy before writing.
+    """
+    if isinstance(data, pd.DataFrame):
+        buffers = ()
+    else:
+        buffers = tuple(sorted(
+            (c, a.__array_interface__["data"][0], a.dtype.str, len(a))
+            for c, a in data.items() if c in rule.columns
+        ))
+    key = (id(frame), rule.signature, buffers)
+
+    with _mask_cache_lock:
+        hit = _mask_cache.get(key)
+        if hit is not None and hit[0]() is frame:
+            _mask_cache.move_to_end(key)
+            return hit[1]
+
+    # Evaluate outside the lock; concurrent misses just compute the same mask twice
+    mask = rule.evaluate(data)
+    mask.flags.writeable = False
+    with _mask_cache_lock:
+        _mask_cache[key] = (weakref.ref(frame), mask)
+        _mask_cache.move_to_end(key)
+        while len(_mask_cache) > MASK_CACHE_SIZE:
+            _mask_cache.popitem(last=False)
+    return mask
+
+def _inject_fallback_signals(df) -> None:
+    """
+    Debug/demo helper: if no entry fires, inject an entry at row 10 and an exit at row 20.
+
+    Rows are positional (not index labels), so frames without a RangeIndex work
+    too. Replaces the signal columns of `df` with whole-column assignments.
+    """
+    n = row_count(df)
+    if n > 20 and not np.asarray(df["entry_signal"]).any():
+        entry = np.zeros(n, dtype=bool)
+        entry[10] = True
+        df["entry_signal"] = entry
+        df["exit_signal"] = np.asarray(df["exit_signal"]) | (np.arange(n) == 20)
+        logger.debug("Injected fallback entry/exit signals for test")
+
 def generate_signals(
     df: pd.DataFrame,
     entry_rule: dict,
     exit_rule: dict,
-    inject_test: bool = True
+    inject_test: bool = True,
+    memoize: bool = False
 ) -> pd.DataFrame:
     """
     Generate entry and exit signal columns using logic rules.
 
-    Applies user-defined strategy logic to each row in the DataFrame.
+    Applies user-defined strategy logic to every row in the DataFrame at once:
+    each rule is evaluated as vectorized column operations (see `eval_logic_vec`),
+    or as one fused Numba kernel for frames over `NUMBA_RULE_MIN_ROWS` rows.
+    Rules are validated once up front (see `validate_rule`).
     Optionally injects fallback signals if no triggers occur (useful for testing).
 
     Args:
         df (pd.DataFrame): OHLCV + indicator DataFrame.
-        entry_rule (dict): Rule defining when to enter trades.
-        exit_rule (dict): Rule defining when to exit trades.
+        entry_rule (dict | Condition | Logic | CompiledRule): Rule defining when to enter trades.
+        exit_rule (dict | Condition | Logic | CompiledRule): Rule defining when to exit trades.
         inject_test (bool): If True and no entry/exit is found,
                             injects fake signals at row 10 and 20.
+                            Pass False in backtest sweeps.
+        memoize (bool): If True, reuse masks from earlier calls on this same frame
+                        (see `cached_mask`). Only for DataFrames that are never
+                        modified, e.g. those returned by `get_indicatorized`.
 
     Returns:
-        pd.DataFrame: Original DataFrame with added:
+        pd.DataFrame: Shallow copy of the input DataFrame with added:
             - entry_signal (bool)
             - exit_signal (bool)
+
+    Raises:
+        ValueError: If a rule is invalid for this frame's columns, or fails to evaluate.
     """
-    df = df.copy()
+    source = df
+
+    # Shallow copy: shares the OHLCV/indicator columns with the caller's (possibly
+    # cached) frame. Whole-column assignment below replaces columns on the copy
+    # only; `.loc[:, col] = ...` would write into the shared arrays instead.
+    df = df.copy(deep=False)
+
+    # Extract each referenced column once, shared by both rules, as a contiguous
+    # array (a no-op for ordinary block columns) for the ufuncs / Numba kernels.
+    # With no referenced column present, rules evaluate on the frame itself (all False).
+    rules = {"entry": compile_rule(entry_rule), "exit": compile_rule(exit_rule)}
+    for name, rule in rules.items():
+        try:
+            validate_rule(rule, df.dtypes)
+        except ValueError as e:
+            raise ValueError(f"Invalid {name} rule: {e}") from None
+    needed = rules["entry"].columns | rules["exit"].columns
+    arrays = {c: np.ascontiguousarray(np.asarray(df[c])) for c in needed if c in df}
+    data = arrays or df
 
-    df["entry_signal"] = df.apply(lambda row: eval_logic(row, entry_rule), axis=1)
-    df["exit_signal"] = df.apply(lambda row: eval_logic(row, exit_rule), axis=1)
+    # Column assignment copies the mask, so cached masks stay untouched by
+    # fallback injection or callers editing the signal columns
+    for name, rule in rules.items():
+        try:
+            mask = cached_mask(source, rule, data) if memoize else rule.evaluate(data)
+        except (TypeError, ValueError) as e:
+            # e.g. a text column holding values that don't compare with the constant
+            raise ValueError(f"Cannot evaluate {name} rule: {e}") from e
+        df[f"{name}_signal"] = mask
 
-    # Fallback signals for debugging/demo purposes
-    if inject_test and not df["entry_signal"].any() and len(df) > 20:
-        df.loc[10, "entry_signal"] = True
-        df.loc[20, "exit_signal"] = True
-        print("[DEBUG] Injected fallback entry/exit signals for test")
+    if inject_test:
+        _inject_fallback_signals(df)
 
-    print("Signal Preview (last 10 rows):")
-    print(df[["timestamp", "entry_signal", "exit_signal"]].tail(10))
+    # Formatting the preview is skipped entirely unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        preview = {c: np.asarray(df[c])[-10:] for c in ("timestamp", "entry_signal", "exit_signal") if c in df}
+        logger.debug("Signal preview (last 10 rows):\n%s", pd.DataFrame(preview))
 
     return df
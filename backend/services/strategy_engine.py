@@ -8,12 +8,25 @@ and rule-based signal creation into higher-level workflows.
 Functions:
 - load_selected_data(): Load OHLCV data for specified exchanges, symbols, and intervals.
 - backtest_strategy(): Apply indicators and signal logic to a single DataFrame.
+- backtest_all(): Run backtest_strategy over a data map in a process pool.
+- batch_backtest(): Full backtest of several symbols as one matrix computation.
 """
 
+import logging
+import multiprocessing
 import os
-from backend.services.data_loader import load_ohlcv
-from backend.services.indicator_engine import add_indicators
-from backend.services.rule_engine import generate_signals
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import product
+import numpy as np
+import pandas as pd
+from backend.models.schema import ExecutionParams
+from backend.services.data_loader import DATA_DIR, load_ohlcv
+from backend.services.indicator_engine import add_indicators, indicators_2d
+from backend.services.rule_engine import compile_rule, generate_signals
+from backend.services.execution_engine import simulate_trades_2d
+from backend.services.performance_engine import calculate_metrics
+
+logger = logging.getLogger(__name__)
 
 def load_selected_data(exchanges, symbols, intervals):
     """
@@ -22,6 +35,8 @@ def load_selected_data(exchanges, symbols, intervals):
     Looks for CSV files in 'backend/data/' using the naming pattern:
         {exchange}_{symbol}_{interval}.csv
 
+    Matching files are loaded concurrently in a thread pool.
+
     Args:
         exchanges (list[str]): List of exchange names (e.g., ["binance", "coinbase"])
         symbols (list[str]): List of trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
@@ -30,33 +45,170 @@ def load_selected_data(exchanges, symbols, intervals):
     Returns:
         dict[str, pd.DataFrame]: Dictionary mapping keys like 'binance_BTCUSDT_1d' to OHLCV DataFrames.
                                  Missing files are skipped with warnings.
+                                 Each frame is tagged with 'exchange', 'symbol' and
+                                 'interval' category columns (1 byte per row each),
+                                 so frames can be combined with `pd.concat`.
     """
-    data_map = {}
-    files = os.listdir("backend/data")
+    # Hashed set of CSV names; scandir lists entries without a stat() per file
+    with os.scandir(DATA_DIR) as it:
+        files_set = {entry.name for entry in it if entry.is_file()}
+
+    # One flat task list over every (exchange, symbol, interval) combination
+    tasks = []
+    for task in product(exchanges, symbols, intervals):
+        filename = "_".join(task) + ".csv"
+        if filename in files_set:
+            tasks.append(task)
+        else:
+            logger.warning("File not found: %s", filename)
+
+    # Shared categories per tag, so frames concatenated later keep the category dtype
+    categories = {
+        "exchange": list(dict.fromkeys(exchanges)),
+        "symbol": list(dict.fromkeys(symbols)),
+        "interval": list(dict.fromkeys(intervals)),
+    }
 
-    for exchange in exchanges:
-        for symbol in symbols:
-            for interval in intervals:
-                filename = f"{exchange}_{symbol}_{interval}.csv"
-                if filename in files:
-                    key = f"{exchange}_{symbol}_{interval}"
-                    data_map[key] = load_ohlcv(exchange, symbol, interval)
-                else:
-                    print(f"[WARN] File not found: {filename}")
-    return data_map
+    def load(task):
+        exchange, symbol, interval = task
+        # Shallow copy: the loaded frame is shared with the load_ohlcv cache
+        df = load_ohlcv(symbol, interval, exchange=exchange).copy(deep=False)
+        for tag, value in zip(categories, task):
+            # int8 codes (what pandas stores for up to 127 categories), no upcast copy
+            code_dtype = np.int8 if len(categories[tag]) <= 127 else np.int32
+            codes = np.full(len(df), categories[tag].index(value), dtype=code_dtype)
+            df[tag] = pd.Categorical.from_codes(codes, categories=categories[tag])
+        return "_".join(task), df
 
-def backtest_strategy(df, entry_rule, exit_rule):
+    # CSV/parquet parsing in pyarrow releases the GIL, so threads load files in
+    # parallel without pickling DataFrames between processes
+    if len(tasks) <= 1:
+        return dict(map(load, tasks))
+    with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        return dict(executor.map(load, tasks))
+
+def backtest_strategy(df, entry_rule, exit_rule, inject_test=True):
     """
     Applies indicators and logic rules to a DataFrame to simulate signals.
 
     Args:
         df (pd.DataFrame): OHLCV data with 'close' column.
-        entry_rule (dict): Entry logic as per schema format.
-        exit_rule (dict): Exit logic as per schema format.
+        entry_rule (dict | CompiledRule): Entry logic as per schema format, or
+                                          precompiled with `compile_rule`.
+        exit_rule (dict | CompiledRule): Exit logic, likewise.
+        inject_test (bool): Inject fallback debug signals if no entry fires
+                            (see `generate_signals`); pass False in sweeps.
 
     Returns:
-        pd.DataFrame: DataFrame with added 'entry_signal' and 'exit_signal' columns.
+        pd.DataFrame: DataFrame with added 'entry_signal' and 'exit_signal' columns
+                      (NumPy bool). Float columns, indicators included, are float32.
     """
     df = add_indicators(df)
-    df = generate_signals(df, entry_rule, exit_rule)
+
+    # float32 keeps ~7 significant digits, ample for rule thresholds, and halves
+    # the bytes each comparison streams (timestamps stay datetime64)
+    df = df.astype(dict.fromkeys(df.select_dtypes("float64").columns, "float32"))
+
+    df = generate_signals(df, entry_rule, exit_rule, inject_test=inject_test)
     return df
+
+def backtest_all(data_map, entry_rule, exit_rule, inject_test=True, max_workers=None):
+    """
+    Runs `backtest_strategy` on every DataFrame of a data map in parallel processes.
+
+    Each frame is backtested independently in a worker of a process pool (with the
+    'spawn' start method, safe on every platform). Results are collected as they
+    complete and returned in the order of `data_map`.
+
+    Args:
+        data_map (dict[str, pd.DataFrame]): Frames keyed e.g. by 'binance_BTCUSDT_1d'
+                                            (see `load_selected_data`).
+        entry_rule (dict | CompiledRule): Entry logic as per schema format.
+        exit_rule (dict | CompiledRule): Exit logic as per schema format.
+        inject_test (bool): Inject fallback debug signals if no entry fires
+                            (see `generate_signals`); pass False in sweeps.
+        max_workers (int): Number of worker processes (default: one per CPU,
+                           at most one per frame).
+
+    Returns:
+        dict[str, pd.DataFrame]: Same keys, mapped to frames with signal columns.
+    """
+    if len(data_map) <= 1:
+        return {
+            key: backtest_strategy(df, entry_rule, exit_rule, inject_test)
+            for key, df in data_map.items()
+        }
+
+    workers = max_workers or min(len(data_map), os.cpu_count() or 1)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = {
+            executor.submit(backtest_strategy, df, entry_rule, exit_rule, inject_test): key
+            for key, df in data_map.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            key = futures[future]
+            results[key] = future.result()
+            logger.debug("Backtested %s (%d/%d)", key, done, len(futures))
+
+    return {key: results[key] for key in data_map}
+
+def batch_backtest(symbols, interval: str, strategy: dict, exec_params: ExecutionParams, inject_test: bool = True):
+    """
+    Runs the full backtest pipeline for several symbols at once.
+
+    Close prices are aligned on timestamp into a (n_bars, n_symbols) float32 matrix.
+    Indicators and trade simulation then run as single parallel kernels over the
+    symbol axis instead of one pipeline call per symbol. Only the entry/exit rules
+    are evaluated per symbol.
+
+    Bars missing for any symbol are dropped, so results match per-symbol backtests
+    only when all symbols share the same timestamps (e.g. same interval and range).
+
+    Args:
+        symbols (list[str]): Trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
+        interval (str): Shared interval (e.g., "1h")
+        strategy (dict): Strategy with 'entry' and 'exit' rules as per schema format.
+        exec_params (ExecutionParams): Execution settings applied to every symbol.
+        inject_test (bool): Inject fallback debug signals if no entry fires
+                            (see `generate_signals`); pass False in sweeps.
+
+    Returns:
+        dict[str, dict]: Symbol -> {"trades": [...], "metrics": {...}}.
+
+    Raises:
+        FileNotFoundError: If data for any symbol is missing.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    frames = {
+        symbol: load_ohlcv(symbol, interval).drop_duplicates("timestamp").set_index("timestamp")
+        for symbol in symbols
+    }
+
+    # Align on the timestamps shared by every symbol
+    closes = pd.concat({s: f["close"] for s, f in frames.items()}, axis=1, join="inner").sort_index()
+    timestamps = closes.index.to_numpy()
+    close_matrix = closes.to_numpy(np.float32)
+    indicators = indicators_2d(close_matrix)
+
+    # Rules reference arbitrary columns, so signals are built per symbol frame
+    # (compiled once, shared by every symbol)
+    entry_rule, exit_rule = compile_rule(strategy["entry"]), compile_rule(strategy["exit"])
+    signal_frames = []
+    entry_sig = np.zeros(close_matrix.shape, dtype=np.bool_)
+    exit_sig = np.zeros(close_matrix.shape, dtype=np.bool_)
+    for j, symbol in enumerate(symbols):
+        df = frames[symbol].reindex(closes.index).reset_index()
+        for name, values in indicators.items():
+            df[name] = values[:, j]
+        df = generate_signals(df, entry_rule, exit_rule, inject_test=inject_test)
+        entry_sig[:, j] = df["entry_signal"].fillna(False).to_numpy(np.bool_)
+        exit_sig[:, j] = df["exit_signal"].fillna(False).to_numpy(np.bool_)
+        signal_frames.append(df)
+
+    trades = simulate_trades_2d(timestamps, close_matrix, entry_sig, exit_sig, exec_params)
+
+    return {
+        symbol: {"trades": symbol_trades, "metrics": calculate_metrics(df, symbol_trades)}
+        for symbol, df, symbol_trades in zip(symbols, signal_frames, trades)
+    }
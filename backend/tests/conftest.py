@@ -0,0 +1,9 @@
+import pytest
+from backend.services import rule_engine
+
+@pytest.fixture(autouse=True)
+def rule_kernel_dir(tmp_path, monkeypatch):
+    """
+    Write generated rule kernel modules to a temporary directory, not the data cache.
+    """
+    monkeypatch.setattr(rule_engine, "RULE_KERNEL_DIR", str(tmp_path))
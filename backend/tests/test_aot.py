@@ -0,0 +1,57 @@
+"""
+Tests for the AOT kernel module (see _aot_build.py): pre-built kernels must give
+the same results as the `@njit` kernels. Skipped unless `fastkernels` is built.
+"""
+
+import numpy as np
+import pytest
+from backend.models.schema import ExecutionParams
+from backend.services import _aot, execution_engine, indicator_engine, performance_engine
+
+fastkernels = pytest.importorskip("backend.services.fastkernels")
+
+ENGINES = [execution_engine, indicator_engine, performance_engine]
+
+@pytest.fixture(autouse=True)
+def _require_current_build():
+    stale = [engine.__name__ for engine in ENGINES if engine._aot is None]
+    if stale:
+        pytest.skip(f"fastkernels was built from older source of {', '.join(stale)}")
+
+def _prices(dtype, n=3000, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    close[rng.choice(n, 10, replace=False)] = np.nan
+    return close.astype(dtype)
+
+def _assert_same(aot_result, jit_result):
+    for aot_value, jit_value in zip(aot_result, jit_result):
+        np.testing.assert_array_equal(aot_value, jit_value)
+
+def test_stale_build_is_ignored(monkeypatch):
+    monkeypatch.setattr(_aot, "source_hash", lambda module_name: -1)
+    assert _aot.load_kernels(execution_engine.__name__) is None
+
+def test_simulate_trades_matches_jit():
+    rng = np.random.default_rng(1)
+    close = _prices(np.float64)
+    ts = np.arange(len(close), dtype=np.int64) * 3_600_000_000_000
+    entry_sig = rng.random(len(close)) < 0.05
+    exit_sig = rng.random(len(close)) < 0.02
+    args = (ts, close, entry_sig, exit_sig, *execution_engine._kernel_params(ExecutionParams()))
+    _assert_same(fastkernels.simulate_trades_nb(*args), execution_engine._simulate_trades_nb(*args))
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_fused_indicators_match_jit(dtype):
+    close = _prices(dtype)
+    aot_kernel = indicator_engine._FUSED_AOT[np.dtype(dtype)]
+    _assert_same(
+        aot_kernel(close, *indicator_engine._ALPHAS),
+        indicator_engine._fused_indicators(close, *indicator_engine._ALPHAS),
+    )
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_price_stats_match_jit(dtype):
+    close = _prices(dtype)
+    aot_kernel = performance_engine._PRICE_STATS_AOT[np.dtype(dtype)]
+    _assert_same(aot_kernel(close), performance_engine._price_stats(close))
@@ -0,0 +1,123 @@
+"""
+Tests for execution_engine.py: the dense (per-bar) and sparse (exit search) trade
+kernels must agree with each other and with the original row-by-row simulation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backend.models.schema import ExecutionParams
+from backend.services import execution_engine
+from backend.services.execution_engine import (
+    SPARSE_SIGNAL_RATIO,
+    _kernel_params,
+    _simulate_trades_nb,
+    _simulate_trades_sparse,
+    simulate_trades,
+)
+
+N_BARS = 5000
+
+def _reference_trades(df: pd.DataFrame, exec_params: ExecutionParams) -> list:
+    """
+    The original `df.iterrows()` simulation loop, over plain arrays.
+    """
+    trades = []
+    in_trade = False
+    slip = exec_params.slippage_bps / 10000
+    fee_pct = exec_params.fee_bps / 10000
+    close = df["close"].to_numpy(dtype=np.float64)
+    timestamps = df["timestamp"].to_numpy()
+
+    for price, ts, entry, exit_ in zip(close, timestamps, df["entry_signal"], df["exit_signal"]):
+        if pd.isna(price) or pd.isna(ts):
+            continue
+
+        if not in_trade and entry:
+            in_trade = True
+            entry_price = price + slip * price
+            entry_time = ts
+            stop_price = entry_price * (1 - exec_params.stop_loss_pct / 100) if exec_params.stop_loss_pct else None
+            target_price = entry_price * (1 + exec_params.take_profit_pct / 100) if exec_params.take_profit_pct else None
+            continue
+
+        if in_trade:
+            hit_tp = target_price is not None and price >= target_price
+            hit_sl = stop_price is not None and price <= stop_price
+            if exit_ or hit_tp or hit_sl:
+                exit_price = price - slip * price
+                net_entry = entry_price * (1 + fee_pct)
+                net_exit = exit_price * (1 - fee_pct)
+                trades.append({
+                    "entry_time": pd.Timestamp(entry_time),
+                    "entry_price": round(entry_price, 2),
+                    "exit_time": pd.Timestamp(ts),
+                    "exit_price": round(exit_price, 2),
+                    "pnl_pct": round((net_exit - net_entry) / net_entry * 100, 2),
+                    "reason": "tp" if hit_tp else "sl" if hit_sl else "exit_signal",
+                })
+                in_trade = False
+    return trades
+
+def _frame(seed: int, entry_ratio: float) -> pd.DataFrame:
+    """
+    Random-walk bars with NaN prices and entries on about `entry_ratio` of the bars.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, N_BARS)))
+    close[rng.choice(N_BARS, 20, replace=False)] = np.nan
+    entry = np.zeros(N_BARS, dtype=bool)
+    entry[rng.choice(N_BARS, int(entry_ratio * N_BARS), replace=False)] = True
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2020-01-01", periods=N_BARS, freq="h"),
+        "close": close,
+        "entry_signal": entry,
+        "exit_signal": rng.random(N_BARS) < 0.002,
+    })
+
+EXEC_PARAMS = [
+    ExecutionParams(),
+    ExecutionParams(stop_loss_pct=0, take_profit_pct=0),
+    ExecutionParams(stop_loss_pct=0.5, take_profit_pct=5, fee_bps=0, slippage_bps=20),
+]
+
+# Entry densities on both sides of SPARSE_SIGNAL_RATIO (and exactly at it)
+RATIOS = [SPARSE_SIGNAL_RATIO / 4, SPARSE_SIGNAL_RATIO, SPARSE_SIGNAL_RATIO * 1.5, 0.2]
+
+@pytest.mark.parametrize("entry_ratio", RATIOS)
+@pytest.mark.parametrize("params", EXEC_PARAMS)
+def test_kernels_agree(entry_ratio, params):
+    for seed in range(5):
+        df = _frame(seed, entry_ratio)
+        args = (
+            np.ascontiguousarray(df["timestamp"].to_numpy().view("i8")),
+            np.ascontiguousarray(df["close"].to_numpy()),
+            df["entry_signal"].to_numpy(),
+            df["exit_signal"].to_numpy(),
+            *_kernel_params(params),
+        )
+        for dense, sparse in zip(_simulate_trades_nb(*args), _simulate_trades_sparse(*args)):
+            np.testing.assert_array_equal(dense, sparse)
+
+@pytest.mark.parametrize("entry_ratio", RATIOS)
+@pytest.mark.parametrize("params", EXEC_PARAMS)
+def test_dispatch_matches_reference(monkeypatch, entry_ratio, params):
+    used = []
+
+    def spy(name, kernel):
+        def wrapped(*args):
+            used.append(name)
+            return kernel(*args)
+        return wrapped
+
+    monkeypatch.setattr(execution_engine, "_simulate_trades_aot", None)
+    monkeypatch.setattr(execution_engine, "_simulate_trades_nb", spy("dense", _simulate_trades_nb))
+    monkeypatch.setattr(execution_engine, "_simulate_trades_sparse", spy("sparse", _simulate_trades_sparse))
+
+    for seed in range(3):
+        df = _frame(seed, entry_ratio)
+        trades = simulate_trades(df, params)
+        assert trades and trades == _reference_trades(df, params)
+
+    expected = "sparse" if entry_ratio <= SPARSE_SIGNAL_RATIO else "dense"
+    assert used == [expected] * 3
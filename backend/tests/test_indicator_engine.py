@@ -0,0 +1,67 @@
+"""
+Tests for indicator_engine.py: the fused kernels must reproduce the `ta` package
+definitions, written here as plain pandas `ewm(adjust=False)` calls.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backend.services.indicator_engine import (
+    INDICATOR_COLUMNS,
+    _ALPHAS,
+    _fused_indicators,
+    _fused_indicators_2d,
+)
+
+def _reference(close: pd.Series) -> dict:
+    """
+    EMA 20/50, RSI 14 and MACD 12/26/9 as computed by `ta` (fillna=False).
+    """
+    def ema(series, span):
+        return series.ewm(span=span, min_periods=span, adjust=False).mean()
+
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0)
+    down = -diff.where(diff < 0, 0.0)
+    avg_gain = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    avg_loss = down.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    rsi = np.where(avg_loss == 0, 100, 100 - (100 / (1 + avg_gain / avg_loss)))
+
+    macd = ema(close, 12) - ema(close, 26)
+    return {
+        "ema_20": ema(close, 20).to_numpy(),
+        "ema_50": ema(close, 50).to_numpy(),
+        "rsi_14": rsi,
+        "macd": macd.to_numpy(),
+        "macd_signal": ema(macd, 9).to_numpy(),
+    }
+
+def _prices(seed: int, n: int, dtype) -> np.ndarray:
+    """
+    Random-walk prices with a flat stretch (constant input) and a few NaN gaps.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    close[200:260] = close[200]
+    close[rng.choice(n, 5, replace=False)] = np.nan
+    return close.astype(dtype)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_fused_indicators_match_reference(dtype):
+    close = _prices(0, 1000, dtype)
+    expected = _reference(pd.Series(close))
+    for name, values in zip(INDICATOR_COLUMNS, _fused_indicators(close, *_ALPHAS)):
+        np.testing.assert_array_equal(values, expected[name], err_msg=name)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_fused_indicators_2d_match_reference(dtype):
+    closes = np.asfortranarray(np.column_stack([_prices(seed, 600, dtype) for seed in range(4)]))
+    results = dict(zip(INDICATOR_COLUMNS, _fused_indicators_2d(closes, *_ALPHAS)))
+    for j in range(closes.shape[1]):
+        expected = _reference(pd.Series(closes[:, j]))
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_array_equal(results[name][:, j], expected[name], err_msg=f"{name}[{j}]")
+
+def test_empty_input():
+    for values in _fused_indicators(np.empty(0), *_ALPHAS):
+        assert values.shape == (0,)
@@ -0,0 +1,85 @@
+"""
+Tests for performance_engine.py: the single-pass `_price_stats` kernel must match
+the pandas definitions it replaces, and the equity curve must agree with the
+reported total return.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from backend.services.performance_engine import (
+    _price_stats,
+    calculate_metrics,
+    generate_equity_curve,
+)
+
+def _reference(close: np.ndarray) -> tuple:
+    """
+    Bar returns, their moments and max drawdown computed with pandas.
+    """
+    series = pd.Series(close.astype(np.float64))
+    returns = series.ffill().pct_change().dropna()
+    cum = series / series.iloc[0]
+    drawdown = cum / cum.cummax() - 1
+    return (
+        returns.to_numpy(),
+        returns.mean(),
+        returns.std(),
+        returns[returns < 0].std(),
+        drawdown.min(),
+    )
+
+def _prices(n=5000, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    close[rng.choice(np.arange(1, n), 25, replace=False)] = np.nan
+    return close
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_price_stats_match_pandas(dtype):
+    close = _prices().astype(dtype)
+    returns, *stats = _price_stats(close)
+    ref_returns, *ref_stats = _reference(close)
+
+    np.testing.assert_allclose(returns, ref_returns, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(stats, ref_stats, rtol=1e-9)
+
+def test_price_stats_drops_leading_nans():
+    close = _prices(200)
+    close[:5] = np.nan
+    returns, *_ = _price_stats(close)
+    np.testing.assert_allclose(returns, pd.Series(close).ffill().pct_change().dropna().to_numpy())
+
+def test_price_stats_short_input():
+    returns, mean, std, downside_std, max_dd = _price_stats(np.array([100.0]))
+    assert returns.size == 0
+    assert np.isnan(mean) and np.isnan(std) and np.isnan(downside_std)
+    assert max_dd == 0.0
+
+def test_cagr_of_wiped_out_account_is_zero():
+    trades = [{
+        "entry_time": "2024-01-01",
+        "exit_time": "2024-06-01",
+        "entry_price": 100.0,
+        "pnl_pct": -150.0,
+    }]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        metrics = calculate_metrics(pd.DataFrame({"close": _prices(500)}), trades)
+    assert metrics["cagr"] == 0.0
+
+def test_equity_curve_ends_at_total_return():
+    trades = [
+        {"entry_time": "2024-01-03", "exit_time": "2024-01-05", "entry_price": 110.0, "pnl_pct": -4.0},
+        {"entry_time": "2024-01-01", "exit_time": "2024-01-02", "entry_price": 100.0, "pnl_pct": 10.0},
+    ]
+    curve = generate_equity_curve(trades, start_value=1000)
+    metrics = calculate_metrics(pd.DataFrame({"close": _prices(100)}), trades)
+
+    assert list(curve["timestamp"]) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-05")]
+    np.testing.assert_allclose(curve["portfolio_value"], [1100.0, 1060.0])
+    assert curve["portfolio_value"].iloc[-1] == pytest.approx(1000 + metrics["totalReturnUsd"])
+
+def test_equity_curve_without_trades():
+    assert list(generate_equity_curve([]).columns) == ["timestamp", "portfolio_value"]
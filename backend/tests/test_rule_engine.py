@@ -0,0 +1,130 @@
+"""
+Tests for rule_engine.py: the numexpr path must agree with the NumPy masks, and
+invalid rules must be rejected up front.
+"""
+
+import threading
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from backend.services import rule_engine
+from backend.services.rule_engine import (
+    CompiledRule,
+    eval_logic_numexpr,
+    eval_logic_vec,
+    generate_signals,
+    rule_to_expr,
+    validate_rule,
+)
+
+OPS = ["<", ">", "<=", ">=", "=", "!="]
+COLUMNS = ["f32", "f32b", "f64", "i64"]
+
+@pytest.fixture(scope="module")
+def frame():
+    """
+    6000 rows of values on a 0.1 grid (so '=' hits), with NaNs in the float columns.
+    """
+    rng = np.random.default_rng(0)
+    n = 6000
+    df = pd.DataFrame({
+        "f32": rng.integers(-10, 11, n) / 10,
+        "f32b": rng.integers(-10, 11, n) / 10,
+        "f64": rng.integers(-10, 11, n) / 10,
+        "i64": rng.integers(-3, 4, n),
+    })
+    for col in ("f32", "f32b", "f64"):
+        df.loc[rng.random(n) < 0.05, col] = np.nan
+    return df.astype({"f32": np.float32, "f32b": np.float32})
+
+def _random_rule(rng, depth=0):
+    if depth < 2 and rng.random() < 0.4:
+        kind = rng.choice(["and", "or", "not"])
+        if kind == "not":
+            return {"not": _random_rule(rng, depth + 1)}
+        return {kind: [_random_rule(rng, depth + 1) for _ in range(rng.integers(1, 4))]}
+    right = (
+        str(rng.choice(COLUMNS)) if rng.random() < 0.3
+        else float(rng.integers(-10, 11) / 10)
+    )
+    return {"left": str(rng.choice(COLUMNS)), "op": str(rng.choice(OPS)), "right": right}
+
+def test_float32_constant_rounding(frame):
+    rule = {"left": "f32", "op": "=", "right": -0.3}
+    expected = eval_logic_vec(frame, rule)
+    assert expected.any()
+    np.testing.assert_array_equal(eval_logic_numexpr(frame, rule), expected)
+
+def test_numexpr_matches_vectorized(frame):
+    rng = np.random.default_rng(1)
+    expressible = 0
+    for _ in range(300):
+        rule = _random_rule(rng)
+        try:
+            rule_to_expr(rule, frame.columns, frame.dtypes)
+            expressible += 1
+        except ValueError:
+            pass
+        np.testing.assert_array_equal(
+            eval_logic_numexpr(frame, rule), eval_logic_vec(frame, rule), err_msg=str(rule)
+        )
+    assert expressible > 200  # The numexpr path itself was exercised
+
+@pytest.mark.parametrize("rule, message", [
+    ({"left": "f64", "op": ">", "right": "3"}, "cannot compare numeric column 'f64' with string '3'"),
+    ({"left": "f64", "op": "==", "right": 1}, "unknown operator '=='"),
+    ({"left": "missing", "op": ">", "right": 1}, "unknown column 'missing'"),
+    ({"left": "f64", "op": ">"}, "operand None"),
+    ({"and": [{"left": "f64", "op": ">", "right": 0}, {"not": {"left": 2, "op": "<", "right": "x"}}]},
+     "cannot compare number 2 with string 'x'"),
+    ({"left": "timestamp", "op": ">", "right": "soon"}, "'soon' is neither a column nor a date"),
+])
+def test_invalid_rules_raise(frame, rule, message):
+    df = frame.assign(timestamp=pd.date_range("2024-01-01", periods=len(frame), freq="h"))
+    with pytest.raises(ValueError, match=message):
+        validate_rule(rule, df.dtypes)
+    with pytest.raises(ValueError, match="Invalid entry rule"):
+        generate_signals(df, rule, {"left": "f64", "op": "<", "right": 0})
+
+def test_valid_rules_pass(frame):
+    df = frame.assign(
+        timestamp=pd.date_range("2024-01-01", periods=len(frame), freq="h"),
+        side=np.where(frame["i64"] > 0, "buy", "sell"),
+    )
+    for rule in (
+        {"left": "f32", "op": "<", "right": "i64"},
+        {"left": "timestamp", "op": ">=", "right": "2024-03-01"},
+        {"left": "side", "op": "=", "right": "buy"},
+        {"or": [{"left": 1, "op": "<", "right": 2}, {"not": {"left": "f64", "op": "!=", "right": 0.5}}]},
+    ):
+        validate_rule(rule, df.dtypes)
+        signals = generate_signals(df, rule, rule, inject_test=False)
+        np.testing.assert_array_equal(signals["entry_signal"], eval_logic_vec(df, rule))
+
+def test_fused_kernel_built_once_across_threads(frame, monkeypatch):
+    calls = []
+
+    def slow_compile(rule, dtypes):
+        calls.append(rule)
+        time.sleep(0.05)
+        return None  # Unsupported: evaluate falls back to the NumPy path
+
+    monkeypatch.setattr(rule_engine, "compile_rule_to_numba", slow_compile)
+    rule = CompiledRule({"left": "f64", "op": ">", "right": 0})
+    barrier = threading.Barrier(8)
+    masks = []
+
+    def worker():
+        barrier.wait()
+        masks.append(rule.evaluate(frame))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    for mask in masks:
+        np.testing.assert_array_equal(mask, eval_logic_vec(frame, rule.rule))
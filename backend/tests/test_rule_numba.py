@@ -0,0 +1,94 @@
+"""
+Tests for the fused Numba rule kernels in rule_engine.py: on frames above
+NUMBA_RULE_MIN_ROWS they replace the NumPy masks and must agree with them.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backend.services.rule_engine import (
+    NUMBA_RULE_MIN_ROWS,
+    CompiledRule,
+    compile_rule_to_numba,
+    eval_logic_vec,
+    validate_rule,
+)
+
+N_ROWS = NUMBA_RULE_MIN_ROWS + 1000
+NUMERIC = ["f32", "f64", "i64", "flag"]
+DATES = ["2024-01-03", "2024-02-01 12:00", "2024-03-15T06:30:00"]
+
+@pytest.fixture(scope="module")
+def frame():
+    """
+    Values on a 0.1 grid (so '=' hits) with NaNs, and hourly timestamps with NaTs.
+    """
+    rng = np.random.default_rng(0)
+    timestamps = pd.Series(pd.date_range("2024-01-01", periods=N_ROWS, freq="h"))
+    df = pd.DataFrame({
+        "timestamp": timestamps.mask(rng.random(N_ROWS) < 0.03),
+        "open_time": timestamps.astype("datetime64[ms]"),
+        "f32": (rng.integers(-10, 11, N_ROWS) / 10).astype(np.float32),
+        "f64": rng.integers(-10, 11, N_ROWS) / 10,
+        "i64": rng.integers(-3, 4, N_ROWS),
+        "flag": rng.random(N_ROWS) < 0.5,
+    })
+    for col in ("f32", "f64"):
+        df.loc[rng.random(N_ROWS) < 0.05, col] = np.nan
+    return df
+
+def _condition(rng):
+    op = str(rng.choice(["<", ">", "<=", ">=", "=", "!="]))
+    if rng.random() < 0.25:
+        left = str(rng.choice(["timestamp", "open_time"]))
+        right = str(rng.choice(DATES + ["timestamp", "open_time"]))
+    else:
+        left = str(rng.choice(NUMERIC))
+        right = (
+            str(rng.choice(NUMERIC)) if rng.random() < 0.3
+            else float(rng.choice([-0.3, 0.0, 0.1, 0.5, 1.0, np.nan]))
+        )
+    return {"left": left, "op": op, "right": right}
+
+def _random_rule(rng, depth=0):
+    if depth < 3 and rng.random() < 0.5:
+        kind = str(rng.choice(["and", "or", "not"]))
+        if kind == "not":
+            return {"not": _random_rule(rng, depth + 1)}
+        return {kind: [_random_rule(rng, depth + 1) for _ in range(rng.integers(0, 4))]}
+    return _condition(rng)
+
+def _assert_fused_matches(frame, rule):
+    fused = compile_rule_to_numba(rule, frame.dtypes)
+    assert fused is not None, rule
+    expected = eval_logic_vec(frame, rule)
+    np.testing.assert_array_equal(fused(frame), expected, err_msg=str(rule))
+    np.testing.assert_array_equal(CompiledRule(rule).evaluate(frame), expected, err_msg=str(rule))
+
+@pytest.mark.parametrize("rule", [
+    {"left": "f32", "op": "=", "right": -0.3},
+    {"left": "f32", "op": ">=", "right": "f64"},
+    {"left": "f64", "op": "!=", "right": 0.5},
+    {"left": "timestamp", "op": ">", "right": "2024-02-01 12:00"},
+    {"left": "open_time", "op": "<=", "right": "timestamp"},
+    {"and": [
+        {"left": "i64", "op": ">", "right": 0},
+        {"or": [{"left": "f32", "op": "<", "right": 0.1}, {"not": {"left": "flag", "op": "=", "right": 1}}]},
+    ]},
+    {"not": {"or": []}},
+    {"and": []},
+])
+def test_fused_kernel_cases(frame, rule):
+    _assert_fused_matches(frame, rule)
+
+def test_fused_kernel_matches_vectorized(frame):
+    rng = np.random.default_rng(1)
+    checked = 0
+    while checked < 100:
+        rule = _random_rule(rng)
+        try:
+            validate_rule(rule, frame.dtypes)
+        except ValueError:
+            continue
+        _assert_fused_matches(frame, rule)
+        checked += 1